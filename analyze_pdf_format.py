@@ -6,11 +6,50 @@ Analyze PDF format to understand why extraction is failing
 import pdfplumber
 from pathlib import Path
 import re
+import sys
+
+try:
+    import pymupdf  # Much faster first-page extraction when installed
+except ImportError:
+    pymupdf = None
+
+# Premium/deductible/OOP patterns, compiled once at import
+PREMIUM_PATTERNS = [
+    (re.compile(r'\$(\d+(?:\.\d{2})?)\s*(?:/\s*)?(?:per\s*)?month', re.IGNORECASE), 'Monthly Premium Pattern 1'),
+    (re.compile(r'Premium.*?\$(\d+(?:\.\d{2})?)', re.IGNORECASE), 'Premium Pattern 2'),
+    (re.compile(r'Monthly premium.*?\$(\d+(?:\.\d{2})?)', re.IGNORECASE), 'Monthly Premium Pattern 3'),
+    (re.compile(r'(\d+(?:\.\d{2})?)\s*/month', re.IGNORECASE), 'Per Month Pattern'),
+    (re.compile(r'Deductible.*?\$(\d+(?:,\d{3})?(?:\.\d{2})?)', re.IGNORECASE), 'Deductible Pattern'),
+    (re.compile(r'Out-of-pocket maximum.*?\$(\d+(?:,\d{3})?(?:\.\d{2})?)', re.IGNORECASE), 'OOP Max Pattern'),
+]
+
+# Lines shorter than 100 characters that contain a dollar amount
+DOLLAR_LINE_PATTERN = re.compile(r'^(?=[^\n]*\$)[^\n]{0,99}$', re.MULTILINE)
+
+# Common plan ID patterns
+ID_PATTERNS = [
+    re.compile(r'Plan ID[:\s]+([A-Z0-9]+)', re.IGNORECASE),
+    re.compile(r'([0-9]{5,}AZ[0-9]+)', re.IGNORECASE),  # Healthcare.gov format
+    re.compile(r'ID#?\s*([0-9]{6,})', re.IGNORECASE),
+]
 
 def clean_text(text):
     """Clean text for safe printing"""
-    # Remove problematic unicode characters
-    return ''.join(char if ord(char) < 128 else '?' for char in text)
+    # Replace problematic unicode characters with '?' via the C codec
+    return text.encode('ascii', 'replace').decode('ascii')
+
+def extract_first_page_text(pdf_path):
+    """Return the first page's text, or None if the PDF has no pages"""
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            if not doc.page_count:
+                return None
+            return doc[0].get_text()
+
+    with pdfplumber.open(pdf_path) as pdf:
+        if not pdf.pages:
+            return None
+        return pdf.pages[0].extract_text() or ""
 
 def analyze_pdf_format():
     pdf_files = [
@@ -24,71 +63,56 @@ def analyze_pdf_format():
         if not pdf_path.exists():
             continue
             
-        print(f"\n{'='*70}")
-        print(f"ANALYZING: {pdf_name}")
-        print('='*70)
+        # Buffer this PDF's report and write it in one call
+        out = []
+        out.append(f"\n{'='*70}")
+        out.append(f"ANALYZING: {pdf_name}")
+        out.append('='*70)
         
-        with pdfplumber.open(pdf_path) as pdf:
-            if not pdf.pages:
-                print("No pages found")
-                continue
-                
-            # Get text from first page
-            text = pdf.pages[0].extract_text() or ""
-            text = clean_text(text)
-            
-            # Show structure
-            print("\nFIRST 600 CHARACTERS:")
-            print(text[:600])
-            
-            # Look for key patterns
-            print("\n" + "="*50)
-            print("SEARCHING FOR KEY VALUES:")
-            print("="*50)
-            
-            # Search for different premium patterns
-            patterns = [
-                (r'\$(\d+(?:\.\d{2})?)\s*(?:/\s*)?(?:per\s*)?month', 'Monthly Premium Pattern 1'),
-                (r'Premium.*?\$(\d+(?:\.\d{2})?)', 'Premium Pattern 2'),
-                (r'Monthly premium.*?\$(\d+(?:\.\d{2})?)', 'Monthly Premium Pattern 3'),
-                (r'(\d+(?:\.\d{2})?)\s*/month', 'Per Month Pattern'),
-                (r'Deductible.*?\$(\d+(?:,\d{3})?(?:\.\d{2})?)', 'Deductible Pattern'),
-                (r'Out-of-pocket maximum.*?\$(\d+(?:,\d{3})?(?:\.\d{2})?)', 'OOP Max Pattern'),
-            ]
-            
-            for pattern, name in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    print(f"\n[FOUND] {name}:")
-                    for match in matches[:3]:  # Show first 3 matches
-                        print(f"  -> ${match}")
-            
-            # Show lines containing dollar amounts
-            print("\n" + "="*50)
-            print("ALL LINES WITH DOLLAR AMOUNTS:")
-            print("="*50)
-            lines = text.split('\n')
-            for line in lines:
-                if '$' in line and len(line) < 100:
-                    print(f"  {line.strip()}")
-            
-            # Look for plan name/ID
-            print("\n" + "="*50)
-            print("POTENTIAL PLAN IDENTIFIERS:")
-            print("="*50)
-            
-            # Common plan ID patterns
-            id_patterns = [
-                r'Plan ID[:\s]+([A-Z0-9]+)',
-                r'([0-9]{5,}AZ[0-9]+)',  # Healthcare.gov format
-                r'ID#?\s*([0-9]{6,})',
-            ]
-            
-            for pattern in id_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    print(f"  Plan ID found: {matches[0]}")
-                    break
+        # Get text from first page
+        text = extract_first_page_text(pdf_path)
+        if text is None:
+            out.append("No pages found")
+            sys.stdout.write('\n'.join(out) + '\n')
+            continue
+        text = clean_text(text)
+        
+        # Show structure
+        out.append("\nFIRST 600 CHARACTERS:")
+        out.append(text[:600])
+        
+        # Look for key patterns
+        out.append("\n" + "="*50)
+        out.append("SEARCHING FOR KEY VALUES:")
+        out.append("="*50)
+        
+        for pattern, name in PREMIUM_PATTERNS:
+            matches = pattern.findall(text)
+            if matches:
+                out.append(f"\n[FOUND] {name}:")
+                for match in matches[:3]:  # Show first 3 matches
+                    out.append(f"  -> ${match}")
+        
+        # Show lines containing dollar amounts
+        out.append("\n" + "="*50)
+        out.append("ALL LINES WITH DOLLAR AMOUNTS:")
+        out.append("="*50)
+        for line in DOLLAR_LINE_PATTERN.findall(text):
+            out.append(f"  {line.strip()}")
+        
+        # Look for plan name/ID
+        out.append("\n" + "="*50)
+        out.append("POTENTIAL PLAN IDENTIFIERS:")
+        out.append("="*50)
+        
+        for pattern in ID_PATTERNS:
+            matches = pattern.findall(text)
+            if matches:
+                out.append(f"  Plan ID found: {matches[0]}")
+                break
+        
+        # Emit the whole per-PDF report with a single write
+        sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     analyze_pdf_format()
\ No newline at end of file
@@ -2,31 +2,51 @@
 """Analyze why scores are identical"""
 
 import json
+from itertools import islice
+
+import numpy as np
+
+try:
+    import ijson  # Stream plan entries instead of loading the whole report
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Faster full-document parsing when streaming is unavailable
+except ImportError:
+    orjson = None
+
+
+def load_plan_analyses(path, limit):
+    """Return the first `limit` plan analyses from a JSON export"""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            return list(islice(ijson.items(f, 'plan_analyses.item', use_float=True), limit))
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        return data['plan_analyses'][:limit]
 
-with open('reports/analysis_export_20250811_133519.json') as f:
-    data = json.load(f)
 
 # Check variety in extracted data
-plans = data['plan_analyses'][:10]
+plans = load_plan_analyses('reports/analysis_export_20250811_133519.json', 10)
 print('EXTRACTED DATA VARIETY CHECK:')
 print('='*50)
 
-premiums = [p['plan']['monthly_premium'] for p in plans]
-deductibles = [p['plan']['deductible'] for p in plans]
-oop_maxes = [p['plan']['oop_max'] for p in plans]
-scores = [p['scores']['overall_weighted'] for p in plans]
+premiums = np.fromiter((p['plan']['monthly_premium'] for p in plans), dtype=float, count=len(plans))
+deductibles = np.fromiter((p['plan']['deductible'] for p in plans), dtype=float, count=len(plans))
+oop_maxes = np.fromiter((p['plan']['oop_max'] for p in plans), dtype=float, count=len(plans))
+scores = np.fromiter((p['scores']['overall_weighted'] for p in plans), dtype=float, count=len(plans))
 
-print(f'Unique premiums: {len(set(premiums))} out of {len(premiums)}')
-print(f'Premium values: {premiums[:5]}')
+print(f'Unique premiums: {np.unique(premiums).size} out of {premiums.size}')
+print(f'Premium values: {premiums[:5].tolist()}')
 print('')
-print(f'Unique deductibles: {len(set(deductibles))} out of {len(deductibles)}')
-print(f'Deductible values: {deductibles[:5]}')
+print(f'Unique deductibles: {np.unique(deductibles).size} out of {deductibles.size}')
+print(f'Deductible values: {deductibles[:5].tolist()}')
 print('')
-print(f'Unique OOP maxes: {len(set(oop_maxes))} out of {len(oop_maxes)}')
-print(f'OOP max values: {oop_maxes[:5]}')
+print(f'Unique OOP maxes: {np.unique(oop_maxes).size} out of {oop_maxes.size}')
+print(f'OOP max values: {oop_maxes[:5].tolist()}')
 print('')
-print(f'Unique scores: {len(set(scores))} out of {len(scores)}')
-print(f'Score values: {scores[:5]}')
+print(f'Unique scores: {np.unique(scores).size} out of {scores.size}')
+print(f'Score values: {scores[:5].tolist()}')
 
 # Check what's causing identical scores
 print('\n' + '='*50)
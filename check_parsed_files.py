@@ -1,58 +1,95 @@
 #!/usr/bin/env python3
 """Check which files are being parsed with real values"""
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from healthplan_navigator.core.ingest import DocumentParser
 
-parser = DocumentParser()
-documents_dir = Path("personal_documents")
-
-# Track successes and failures
-successful = []
-zero_premium = []
-failed = []
-
-for file_path in documents_dir.glob("*"):
-    if file_path.suffix.lower() in ['.pdf', '.docx']:
-        try:
-            plan = parser.parse_document(str(file_path))
-            if plan:
-                if plan.monthly_premium > 0 or plan.deductible > 0 or plan.oop_max > 0:
-                    successful.append({
-                        'file': file_path.name,
-                        'premium': plan.monthly_premium,
-                        'deductible': plan.deductible,
-                        'oop_max': plan.oop_max
-                    })
+DOCUMENT_SUFFIXES = frozenset({'.pdf', '.docx'})
+
+
+# One parser per worker process, built by the pool initializer
+_parser = None
+
+
+def _init_worker():
+    """Create the worker's DocumentParser once."""
+    global _parser
+    _parser = DocumentParser()
+
+
+def _parse_one(path_str):
+    """Parse a single document in a worker process."""
+    return _parser.parse_document(path_str)
+
+
+def iter_documents(directory):
+    """Yield supported document files in a directory without extra stat calls."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in DOCUMENT_SUFFIXES and entry.is_file():
+                yield Path(entry.path)
+
+
+def main():
+    documents_dir = Path("personal_documents")
+    paths = list(iter_documents(documents_dir))
+
+    # Track successes and failures
+    successful = []
+    zero_premium = []
+    failed = []
+
+    # pdfplumber is CPU-bound, so fan the files out across processes
+    max_workers = min(os.cpu_count() or 1, 4)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(_parse_one, str(file_path)) for file_path in paths]
+
+        for file_path, future in zip(paths, futures):
+            try:
+                plan = future.result()
+                if plan:
+                    if plan.monthly_premium > 0 or plan.deductible > 0 or plan.oop_max > 0:
+                        successful.append({
+                            'file': file_path.name,
+                            'premium': plan.monthly_premium,
+                            'deductible': plan.deductible,
+                            'oop_max': plan.oop_max
+                        })
+                    else:
+                        zero_premium.append(file_path.name)
                 else:
-                    zero_premium.append(file_path.name)
-            else:
-                failed.append(file_path.name)
-        except Exception as e:
-            failed.append(f"{file_path.name} (error: {e})")
-
-print("PARSING RESULTS SUMMARY")
-print("="*60)
-print(f"Successfully parsed with values: {len(successful)}")
-print(f"Parsed but all zeros: {len(zero_premium)}")
-print(f"Failed to parse: {len(failed)}")
-
-print("\n" + "="*60)
-print("FILES WITH ACTUAL VALUES:")
-print("="*60)
-for item in successful:
-    print(f"\n{item['file']}")
-    print(f"  Premium: ${item['premium']}")
-    print(f"  Deductible: ${item['deductible']}")
-    print(f"  OOP Max: ${item['oop_max']}")
-
-if zero_premium:
+                    failed.append(file_path.name)
+            except Exception as e:
+                failed.append(f"{file_path.name} (error: {e})")
+
+    print("PARSING RESULTS SUMMARY")
+    print("="*60)
+    print(f"Successfully parsed with values: {len(successful)}")
+    print(f"Parsed but all zeros: {len(zero_premium)}")
+    print(f"Failed to parse: {len(failed)}")
+
     print("\n" + "="*60)
-    print("FILES WITH ALL ZEROS (need fixing):")
+    print("FILES WITH ACTUAL VALUES:")
     print("="*60)
-    for file in zero_premium[:10]:  # Show first 10
-        print(f"  - {file}")
\ No newline at end of file
+    for item in successful:
+        print(f"\n{item['file']}")
+        print(f"  Premium: ${item['premium']}")
+        print(f"  Deductible: ${item['deductible']}")
+        print(f"  OOP Max: ${item['oop_max']}")
+
+    if zero_premium:
+        print("\n" + "="*60)
+        print("FILES WITH ALL ZEROS (need fixing):")
+        print("="*60)
+        for file in zero_premium[:10]:  # Show first 10
+            print(f"  - {file}")
+
+
+if __name__ == "__main__":
+    main()
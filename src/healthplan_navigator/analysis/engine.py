@@ -1,33 +1,94 @@
-from typing import List, Dict
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Dict, Optional
+import numpy as np
 from ..core.models import Client, Plan, PlanAnalysis, AnalysisReport
 from ..core.score import HealthPlanScorer
 
 
+# Per-process state for parallel scoring, set once by the pool initializer
+# so the client and plan list are pickled per worker rather than per task.
+_worker_scorer = None
+_worker_client = None
+_worker_plans = None
+
+
+def _init_scoring_worker(client: Client, plans: List[Plan]):
+    """Initialize a scoring worker process with the shared inputs."""
+    global _worker_scorer, _worker_client, _worker_plans
+    _worker_scorer = HealthPlanScorer()
+    _worker_client = client
+    _worker_plans = plans
+
+
+def _score_plan_at(index: int) -> PlanAnalysis:
+    """Score the plan at the given index inside a worker process (cost score deferred)."""
+    return _worker_scorer.score_plan_deferred(_worker_client, _worker_plans[index])
+
+
 class AnalysisEngine:
     """Main analysis engine that orchestrates plan scoring and ranking."""
     
     def __init__(self):
         self.scorer = HealthPlanScorer()
     
-    def analyze_plans(self, client: Client, plans: List[Plan]) -> AnalysisReport:
+    def analyze_plans(self, client: Client, plans: List[Plan], full_rank: bool = True,
+                      max_workers: Optional[int] = None) -> AnalysisReport:
         """
         Analyze all plans for a client and generate comprehensive report.
         Returns plans ranked by weighted score (0-10 scale).
+        
+        With full_rank=False only the top 3 recommendations are ranked and
+        plan_analyses is left in input order, which avoids a full sort when
+        the caller does not need the complete ranking.
+        
+        Passing max_workers > 1 scores plans in a process pool; this only
+        pays off for large plan sets, so scoring is sequential by default.
         """
         if not plans:
             raise ValueError("No plans provided for analysis")
         
         # Score all plans
-        plan_analyses = []
-        for plan in plans:
-            analysis = self.scorer.score_plan(client, plan, plans)
-            plan_analyses.append(analysis)
+        if max_workers and max_workers > 1 and len(plans) > 1:
+            plan_analyses = self._score_plans_parallel(client, plans, max_workers)
+        else:
+            plan_analyses = self.scorer.score_plans(client, plans)
         
-        # Sort by weighted total score (descending)
-        plan_analyses.sort(key=lambda x: x.metrics.weighted_total_score, reverse=True)
+        return self._build_report(client, plan_analyses, full_rank)
+    
+    def analyze_plans_streaming(self, client: Client, plans: Iterable[Plan],
+                                full_rank: bool = True) -> AnalysisReport:
+        """
+        Analyze plans as an iterable yields them.
         
-        # Get top 3 recommendations
-        top_recommendations = plan_analyses[:3]
+        Each plan is scored on arrival, so scoring overlaps with whatever is
+        still producing plans (e.g. document parsing). Only the cost score
+        needs the whole set; it is applied once the iterable is exhausted,
+        and the results match analyze_plans for the same plans.
+        """
+        plan_analyses = self.scorer.score_plans(client, plans)
+        if not plan_analyses:
+            raise ValueError("No plans provided for analysis")
+
+        return self._build_report(client, plan_analyses, full_rank)
+    
+    def _build_report(self, client: Client, plan_analyses: List[PlanAnalysis],
+                      full_rank: bool = True) -> AnalysisReport:
+        """Rank scored plans and package them into a report."""
+        if full_rank:
+            # Sort by weighted total score (descending); a stable argsort on the
+            # negated scores keeps tied plans in input order like list.sort did.
+            # Totals are rounded to 2 decimals, which float32 orders exactly
+            scores = np.fromiter((a.metrics.weighted_total_score for a in plan_analyses),
+                                 dtype=np.float32, count=len(plan_analyses))
+            order = np.argsort(-scores, kind='stable')
+            plan_analyses = [plan_analyses[i] for i in order]
+            
+            # Get top 3 recommendations
+            top_recommendations = plan_analyses[:3]
+        else:
+            top_recommendations = heapq.nlargest(3, plan_analyses, key=lambda x: x.metrics.weighted_total_score)
         
         # Create comprehensive report
         report = AnalysisReport(
@@ -38,6 +99,24 @@ class AnalysisEngine:
         
         return report
     
+    def _score_plans_parallel(self, client: Client, plans: List[Plan], max_workers: int) -> List[PlanAnalysis]:
+        """Score plans across worker processes, preserving input order."""
+        max_workers = min(max_workers, os.cpu_count() or 1, len(plans))
+        chunksize = max(1, len(plans) // (max_workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_scoring_worker,
+                                 initargs=(client, plans)) as executor:
+            plan_analyses = list(executor.map(_score_plan_at, range(len(plans)), chunksize=chunksize))
+        
+        # Workers return pickled copies; point results back at the caller's plans
+        for analysis, plan in zip(plan_analyses, plans):
+            analysis.plan = plan
+        
+        # Cost scores are normalized over the whole set, so apply them here
+        self.scorer.apply_cost_scores(plan_analyses)
+        return plan_analyses
+    
     def generate_scoring_matrix(self, report: AnalysisReport) -> List[Dict]:
         """
         Generate a scoring matrix showing all metrics for all plans.
@@ -45,22 +124,24 @@ class AnalysisEngine:
         """
         matrix = []
         
-        for analysis in report.plan_analyses:
+        for rank, analysis in enumerate(report.plan_analyses, start=1):
+            plan = analysis.plan
+            metrics = analysis.metrics
             row = {
-                'Plan Name': analysis.plan.marketing_name,
-                'Plan ID': analysis.plan.plan_id,
-                'Issuer': analysis.plan.issuer,
-                'Metal Level': analysis.plan.metal_level.value,
-                'Monthly Premium': f"${analysis.plan.monthly_premium:.2f}",
+                'Plan Name': plan.marketing_name,
+                'Plan ID': plan.plan_id,
+                'Issuer': plan.issuer,
+                'Metal Level': plan.metal_level.value,
+                'Monthly Premium': f"${plan.monthly_premium:.2f}",
                 'Estimated Annual Cost': f"${analysis.estimated_annual_cost:.2f}",
-                'Provider Network Score': f"{analysis.metrics.provider_network_score:.1f}/10",
-                'Medication Coverage Score': f"{analysis.metrics.medication_coverage_score:.1f}/10",
-                'Total Cost Score': f"{analysis.metrics.total_cost_score:.1f}/10",
-                'Financial Protection Score': f"{analysis.metrics.financial_protection_score:.1f}/10",
-                'Administrative Score': f"{analysis.metrics.administrative_simplicity_score:.1f}/10",
-                'Plan Quality Score': f"{analysis.metrics.plan_quality_score:.1f}/10",
-                'OVERALL SCORE': f"{analysis.metrics.weighted_total_score:.1f}/10",
-                'Rank': report.plan_analyses.index(analysis) + 1
+                'Provider Network Score': f"{metrics.provider_network_score:.1f}/10",
+                'Medication Coverage Score': f"{metrics.medication_coverage_score:.1f}/10",
+                'Total Cost Score': f"{metrics.total_cost_score:.1f}/10",
+                'Financial Protection Score': f"{metrics.financial_protection_score:.1f}/10",
+                'Administrative Score': f"{metrics.administrative_simplicity_score:.1f}/10",
+                'Plan Quality Score': f"{metrics.plan_quality_score:.1f}/10",
+                'OVERALL SCORE': f"{metrics.weighted_total_score:.1f}/10",
+                'Rank': rank
             }
             matrix.append(row)
         
@@ -73,6 +154,14 @@ class AnalysisEngine:
         
         top_plan = report.top_recommendations[0]
         
+        # Find cheapest and most expensive plans in a single pass
+        lowest_cost_plan = highest_cost_plan = report.plan_analyses[0]
+        for analysis in report.plan_analyses:
+            if analysis.estimated_annual_cost < lowest_cost_plan.estimated_annual_cost:
+                lowest_cost_plan = analysis
+            elif analysis.estimated_annual_cost > highest_cost_plan.estimated_annual_cost:
+                highest_cost_plan = analysis
+        
         summary = {
             'total_plans_analyzed': len(report.plan_analyses),
             'recommended_plan': {
@@ -85,9 +174,9 @@ class AnalysisEngine:
             'key_strengths': self._identify_plan_strengths(top_plan),
             'potential_concerns': self._identify_plan_concerns(top_plan),
             'cost_comparison': {
-                'lowest_cost_plan': min(report.plan_analyses, key=lambda x: x.estimated_annual_cost),
-                'highest_cost_plan': max(report.plan_analyses, key=lambda x: x.estimated_annual_cost),
-                'cost_savings_vs_highest': max(report.plan_analyses, key=lambda x: x.estimated_annual_cost).estimated_annual_cost - top_plan.estimated_annual_cost
+                'lowest_cost_plan': lowest_cost_plan,
+                'highest_cost_plan': highest_cost_plan,
+                'cost_savings_vs_highest': highest_cost_plan.estimated_annual_cost - top_plan.estimated_annual_cost
             }
         }
         
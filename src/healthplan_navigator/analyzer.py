@@ -31,15 +31,25 @@ Statistical Features (Gold Standard Compliance):
 - Sensitivity analysis on scoring weights
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, Iterator, Tuple
+import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import os
+import pickle
+import queue
+import threading
 
 # Core models for client profiles, plans, and analysis results
-from .core.models import Client, Plan, AnalysisReport, validate_zipcode
+from .core.models import Client, Plan, MetalLevel, PlanType, AnalysisReport, validate_zipcode
 # Document parsing engine supporting multiple formats
-from .core.ingest import DocumentParser
+from .core.ingest import DocumentParser, _init_parse_worker, _parse_in_worker
 # Analysis engine with 6-metric scoring system
 from .analysis.engine import AnalysisEngine
 # Report generation in multiple formats (MD, CSV, JSON, HTML)
@@ -51,6 +61,40 @@ from .integrations.medications import MedicationIntegration
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on parse tasks in flight, so huge directories don't queue
+# thousands of futures (and their results) at once
+MAX_PENDING_PARSES = 32
+
+# Documents each parse worker handles before the pool is replaced; PDF
+# libraries hold on to C-level buffers, so recycling workers keeps memory
+# bounded on large batches
+PARSE_TASKS_PER_WORKER = 50
+
+# Bound on parsed plans waiting to be scored when streaming (backpressure for
+# the parser thread), and how often a blocked parser thread checks whether
+# the consumer has gone away
+MAX_QUEUED_PLANS = 32
+QUEUE_PUT_TIMEOUT_SECONDS = 0.1
+
+
+class _PlanStreamClosed(Exception):
+    """Raised in the plan loader thread once nobody is consuming its plans."""
+
+# Report formats _generate_reports can write ('all' selects every one)
+REPORT_FORMATS = frozenset({'summary', 'csv', 'json', 'html'})
+
+# Parsed-plan cache settings: bump the version whenever parsing output changes
+# so stale pickles are ignored; least-used entries beyond the limit are evicted
+PLAN_CACHE_VERSION = 3
+PLAN_CACHE_MAX_ENTRIES = 500
+
+# Healthcare.gov searches are sharded per metal level and issued
+# concurrently. Few enough shards to fit within the API client's rate-limit
+# burst, so fetch latency tracks the slowest shard; every shard keeps the
+# same plan type filter
+HEALTHCARE_GOV_METAL_LEVELS = ['Bronze', 'Silver', 'Gold', 'Platinum']
+HEALTHCARE_GOV_PLAN_TYPES = ['HMO', 'PPO', 'EPO', 'POS']
+
 
 class HealthPlanAnalyzer:
     """
@@ -74,7 +118,15 @@ class HealthPlanAnalyzer:
         )
     """
     
-    def __init__(self, output_dir: str = "./reports", api_keys: Optional[Dict[str, str]] = None):
+    # Healthcare.gov enum values (upper-cased) -> enum members, built once
+    _METAL_MAP = {level.value.upper(): level for level in MetalLevel}
+    _PLAN_TYPE_MAP = {plan_type.value.upper(): plan_type for plan_type in PlanType}
+    
+    # Healthcare.gov plan record fields that must be present to convert
+    _REQUIRED_API_FIELDS = ('plan_id', 'plan_marketing_name', 'issuer_name')
+    
+    def __init__(self, output_dir: str = "./reports", api_keys: Optional[Dict[str, str]] = None,
+                 use_plan_cache: bool = True):
         """
         Initialize the HealthPlanAnalyzer with all components.
         
@@ -88,6 +140,11 @@ class HealthPlanAnalyzer:
             output_dir: Directory for generated reports (creates if not exists)
             api_keys: Optional dictionary of API keys for external services
                      Keys: 'healthcare_gov', 'nppes', 'rxnorm', 'goodrx'
+            use_plan_cache: Reuse parsed plans from output_dir/.plan_cache for
+                            files whose content hash has been parsed before.
+                            Cached plans are pickles, so output_dir must only
+                            be writable by trusted users; disable the cache
+                            when it is shared.
         """
         # Initialize core components
         self.parser = DocumentParser()  # Handles PDF, DOCX, JSON, CSV
@@ -98,17 +155,52 @@ class HealthPlanAnalyzer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize API integrations (v1.1.0 feature)
-        api_keys = api_keys or {}
-        self.healthcare_gov_api = HealthcareGovAPI(api_key=api_keys.get('healthcare_gov'))
-        self.provider_integration = ProviderNetworkIntegration(nppes_api_key=api_keys.get('nppes'))
-        self.medication_integration = MedicationIntegration(goodrx_api_key=api_keys.get('goodrx'))
+        # Content-hash keyed cache of parsed plans (index loaded lazily)
+        self.use_plan_cache = use_plan_cache
+        self._plan_cache_dir = self.output_dir / ".plan_cache"
+        self._plan_cache_counts: Optional[Dict[str, int]] = None
+        self._plan_cache_digests: Optional[Dict[str, List]] = None
+        
+        # Per-load record of what was loaded, logged once per load
+        self._load_stats = self._new_load_stats()
+        
+        # API integrations (v1.1.0 feature) are created on first use, so
+        # local-file runs never set up HTTP sessions or API cache directories
+        self._api_keys = api_keys or {}
+        self._healthcare_gov_api: Optional[HealthcareGovAPI] = None
+        self._provider_integration: Optional[ProviderNetworkIntegration] = None
+        self._medication_integration: Optional[MedicationIntegration] = None
+    
+    @property
+    def healthcare_gov_api(self) -> HealthcareGovAPI:
+        """Healthcare.gov marketplace client, created on first access."""
+        if self._healthcare_gov_api is None:
+            self._healthcare_gov_api = HealthcareGovAPI(api_key=self._api_keys.get('healthcare_gov'))
+        return self._healthcare_gov_api
+    
+    @property
+    def provider_integration(self) -> ProviderNetworkIntegration:
+        """NPPES provider network integration, created on first access."""
+        if self._provider_integration is None:
+            self._provider_integration = ProviderNetworkIntegration(nppes_api_key=self._api_keys.get('nppes'))
+        return self._provider_integration
+    
+    @property
+    def medication_integration(self) -> MedicationIntegration:
+        """RxNorm/GoodRx medication integration, created on first access."""
+        if self._medication_integration is None:
+            self._medication_integration = MedicationIntegration(goodrx_api_key=self._api_keys.get('goodrx'))
+        return self._medication_integration
     
     def analyze(self, 
                 client: Client,
                 plan_sources: Optional[Union[str, List[str]]] = None,
                 healthcare_gov_fetch: bool = False,
-                formats: List[str] = None) -> AnalysisReport:
+                formats: List[str] = None,
+                parallel: bool = True,
+                max_workers: Optional[int] = None,
+                fast_parse: bool = False,
+                stream: bool = False) -> AnalysisReport:
         """
         Run complete analysis pipeline with 6-metric scoring.
         
@@ -125,6 +217,12 @@ class HealthPlanAnalyzer:
             plan_sources: Path(s) to plan files or directory (supports PDF, DOCX, JSON, CSV)
             healthcare_gov_fetch: Whether to fetch plans from Healthcare.gov API (uses CMS fallback)
             formats: Report formats to generate ['summary', 'csv', 'json', 'html', 'all']
+            parallel: Parse directory sources across worker processes
+            max_workers: Worker process limit for parallel parsing (defaults to CPU count)
+            fast_parse: Read only the first page of PDFs when it holds the premium,
+                        deductible and OOP max (later-page copays are then skipped)
+            stream: Score plans while the rest are still being parsed; tied
+                    plans are then ranked in parse completion order
         
         Returns:
             AnalysisReport with all scored and ranked plans, including:
@@ -139,19 +237,33 @@ class HealthPlanAnalyzer:
         # Store client reference for location-based fetching (used by Healthcare.gov API)
         self._current_client = client
         
-        # Load plans from all sources (local files + optional API fetch)
-        plans = self._load_plans(plan_sources, healthcare_gov_fetch)
-        
-        # Clean up client reference after loading
-        self._current_client = None
-        
-        # Validate we have plans to analyze
-        if not plans:
-            raise ValueError("No plans available for analysis")
-        
-        # Run comprehensive 6-metric analysis on all plans
-        # This calculates scores for each metric and generates rankings
-        report = self.engine.analyze_plans(client, plans)
+        if stream:
+            # Parse on a background thread and score each plan as it arrives
+            plans = self._stream_plans(plan_sources, healthcare_gov_fetch, parallel, max_workers, fast_parse)
+            try:
+                # Only an empty stream means "no plans"; loader and scoring
+                # errors propagate unchanged
+                first_plan = next(plans, None)
+                if first_plan is None:
+                    raise ValueError("No plans available for analysis")
+                report = self.engine.analyze_plans_streaming(client, itertools.chain([first_plan], plans))
+            finally:
+                plans.close()
+                self._current_client = None
+        else:
+            # Load plans from all sources (local files + optional API fetch)
+            plans = self._load_plans(plan_sources, healthcare_gov_fetch, parallel, max_workers, fast_parse)
+            
+            # Clean up client reference after loading
+            self._current_client = None
+            
+            # Validate we have plans to analyze
+            if not plans:
+                raise ValueError("No plans available for analysis")
+            
+            # Run comprehensive 6-metric analysis on all plans
+            # This calculates scores for each metric and generates rankings
+            report = self.engine.analyze_plans(client, plans)
         
         # Generate requested report formats (summary, CSV, JSON, HTML)
         if formats:
@@ -159,25 +271,57 @@ class HealthPlanAnalyzer:
         
         return report
     
+    async def analyze_async(self,
+                            client: Client,
+                            plan_sources: Optional[Union[str, List[str]]] = None,
+                            healthcare_gov_fetch: bool = False,
+                            formats: List[str] = None,
+                            parallel: bool = True,
+                            max_workers: Optional[int] = None,
+                            fast_parse: bool = False,
+                            stream: bool = False) -> AnalysisReport:
+        """
+        Awaitable analyze() for use inside an event loop (e.g. a web service).
+        
+        Parsing, scoring and report writes are all blocking, so the whole
+        pipeline runs in the loop's default executor and other requests keep
+        being served meanwhile. Arguments are the same as analyze(). An
+        analyzer tracks the client of the run in progress, so use one
+        instance per concurrent analysis.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.analyze, client, plan_sources, healthcare_gov_fetch, formats,
+                              parallel, max_workers, fast_parse, stream)
+        )
+    
     def _load_plans(self, 
                     plan_sources: Optional[Union[str, List[str]]] = None,
-                    healthcare_gov_fetch: bool = False) -> List[Plan]:
+                    healthcare_gov_fetch: bool = False,
+                    parallel: bool = True,
+                    max_workers: Optional[int] = None,
+                    fast_parse: bool = False) -> List[Plan]:
         """
         Load plans from various sources (local and/or API).
         
         Supports:
         - Single files (PDF, DOCX, JSON, CSV)
-        - Directories for batch processing
+        - Directories for batch processing (parsed in a process pool when parallel)
         - Healthcare.gov API with CMS public data fallback
         
         Args:
             plan_sources: File paths or directory to load
             healthcare_gov_fetch: Whether to fetch from Healthcare.gov
+            parallel: Parse directory files across worker processes
+            max_workers: Worker process limit (defaults to CPU count)
+            fast_parse: Try first-page-only PDF extraction before the full parse
         
         Returns:
             List of parsed Plan objects ready for analysis
         """
         plans = []  # Accumulator for all loaded plans
+        self._load_stats = stats = self._new_load_stats()
         
         # Load from local files/directory
         if plan_sources:
@@ -192,26 +336,390 @@ class HealthPlanAnalyzer:
                 if source_path.is_dir():
                     # Batch process all supported files in directory
                     # Automatically handles PDF, DOCX, JSON, CSV files
-                    batch_plans = self.parser.parse_batch(str(source_path))
+                    batch_plans = self._parse_directory(source_path, parallel, max_workers, fast_parse)
                     plans.extend(batch_plans)
-                    logger.info(f"Loaded {len(batch_plans)} plans from {source_path}")
+                    logger.debug(f"Loaded {len(batch_plans)} plans from {source_path}")
                 elif source_path.is_file():
                     # Parse single file based on extension
-                    plan = self.parser.parse_document(str(source_path))
+                    plan = self._parse_file_cached(source_path, fast_parse)
                     if plan:
                         plans.append(plan)
-                        logger.info(f"Loaded plan from {source_path.name}")
+                        stats['files'].append(source_path.name)
+                        logger.debug(f"Loaded plan from {source_path.name}")
+            
+            self._save_plan_cache_index()
         
         # Fetch from Healthcare.gov API (v1.1.0 feature)
         if healthcare_gov_fetch:
             hc_plans = self._fetch_healthcare_gov_plans()
             plans.extend(hc_plans)
-            if hc_plans:
-                logger.info(f"Fetched {len(hc_plans)} plans from Healthcare.gov")
+            stats['api_fetched'] = len(hc_plans)
         
-        logger.info(f"Total plans loaded: {len(plans)}")
+        stats['total'] = len(plans)
+        self._log_load_stats()
         return plans
     
+    @staticmethod
+    def _new_load_stats() -> Dict[str, Any]:
+        """Empty load record: parsed/cached/failed file names and API plan count."""
+        return {'files': [], 'cached': [], 'errors': [], 'api_fetched': 0, 'total': 0}
+    
+    def _log_load_stats(self):
+        """Log the current load record as a single JSON line."""
+        logger.info(f"load_stats {json.dumps(self._load_stats)}")
+    
+    def _stream_plans(self,
+                      plan_sources: Optional[Union[str, List[str]]] = None,
+                      healthcare_gov_fetch: bool = False,
+                      parallel: bool = True,
+                      max_workers: Optional[int] = None,
+                      fast_parse: bool = False) -> Iterator[Plan]:
+        """
+        Yield plans from the same sources as _load_plans as soon as each is ready.
+        
+        A background thread parses into a queue bounded by MAX_QUEUED_PLANS,
+        so parsing blocks rather than piling up plans when scoring falls
+        behind. Directory plans arrive in parse completion order. A loading
+        failure is re-raised here rather than ending the stream early, and
+        closing the generator stops the loader thread (and its parse pool).
+        """
+        plan_queue = queue.Queue(maxsize=MAX_QUEUED_PLANS)
+        finished = object()  # Sentinel marking the end of the stream
+        stop = threading.Event()  # Set once the consumer stops reading
+        
+        self._load_stats = stats = self._new_load_stats()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    plan_queue.put(item, timeout=QUEUE_PUT_TIMEOUT_SECONDS)
+                    return
+                except queue.Full:
+                    continue
+            raise _PlanStreamClosed()
+        
+        def produce():
+            count = 0
+            end = finished
+            try:
+                if plan_sources:
+                    sources = [plan_sources] if isinstance(plan_sources, str) else plan_sources
+                    for source in sources:
+                        source_path = Path(source)
+                        if source_path.is_dir():
+                            # Closed explicitly so an abandoned stream shuts its pool down
+                            with contextlib.closing(self._iter_directory(
+                                    source_path, parallel, max_workers, fast_parse)) as directory_plans:
+                                for _, plan in directory_plans:
+                                    put(plan)
+                                    count += 1
+                        elif source_path.is_file():
+                            plan = self._parse_file_cached(source_path, fast_parse)
+                            if plan:
+                                put(plan)
+                                count += 1
+                                stats['files'].append(source_path.name)
+                    
+                    self._save_plan_cache_index()
+                
+                if healthcare_gov_fetch:
+                    for plan in self._fetch_healthcare_gov_plans():
+                        put(plan)
+                        count += 1
+                        stats['api_fetched'] += 1
+            except _PlanStreamClosed:
+                return
+            except Exception as e:
+                logger.error(f"Error loading plans: {e}")
+                end = e  # Handed to the consumer to re-raise
+            finally:
+                stats['total'] = count
+                self._log_load_stats()
+            try:
+                put(end)
+            except _PlanStreamClosed:
+                pass
+        
+        producer = threading.Thread(target=produce, name="plan-loader", daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                plan = plan_queue.get()
+                if plan is finished:
+                    break
+                if isinstance(plan, Exception):
+                    raise plan
+                yield plan
+        finally:
+            stop.set()
+        
+        producer.join()
+    
+    def _parse_directory(self, directory: Path, parallel: bool = True,
+                         max_workers: Optional[int] = None,
+                         fast_parse: bool = False) -> List[Plan]:
+        """
+        Parse all supported documents in a directory.
+        
+        Files already in the plan cache are loaded from it. The rest are
+        parsed serially, or fanned out across worker processes when parallel
+        (PDF/DOCX extraction is CPU-bound). At most MAX_PENDING_PARSES tasks
+        are in flight at a time, failures are logged per file, and plans are
+        returned in the same order parse_batch would produce.
+        
+        Args:
+            directory: Directory containing plan documents
+            parallel: Parse uncached files in a process pool
+            max_workers: Worker process limit (defaults to CPU count)
+            fast_parse: Try first-page-only PDF extraction before the full parse
+        
+        Returns:
+            List of successfully parsed Plan objects
+        """
+        results = dict(self._iter_directory(directory, parallel, max_workers, fast_parse))
+        return [results[index] for index in sorted(results)]
+    
+    def _iter_directory(self, directory: Path, parallel: bool = True,
+                        max_workers: Optional[int] = None,
+                        fast_parse: bool = False) -> Iterator[Tuple[int, Plan]]:
+        """
+        Yield (file index, plan) pairs for a directory as plans become available.
+        
+        Cached plans come first, then parsed plans in completion order; the
+        index is the file's position in the directory listing.
+        """
+        files = [path for path in directory.glob("*")
+                 if path.suffix.lower() in DocumentParser.SUPPORTED_EXTENSIONS]
+        
+        stats = self._load_stats
+        
+        to_parse = []
+        for index, file_path in enumerate(files):
+            cache_key = self._plan_cache_key(file_path, fast_parse)
+            plan = self._load_cached_plan(cache_key)
+            if plan is not None:
+                stats['cached'].append(file_path.name)
+                logger.debug(f"Loaded cached plan for {file_path.name}")
+                yield index, plan
+            else:
+                to_parse.append((index, file_path, cache_key))
+        
+        def record(file_path, cache_key, plan):
+            if plan:
+                self._store_cached_plan(cache_key, plan)
+                stats['files'].append(file_path.name)
+                logger.debug(f"Successfully parsed plan from {file_path.name}")
+            else:
+                stats['errors'].append(file_path.name)
+                logger.warning(f"No plan data extracted from {file_path.name}")
+            return plan
+        
+        # Not worth spinning up a pool for a single file
+        if not parallel or len(to_parse) <= 1:
+            for index, file_path, cache_key in to_parse:
+                try:
+                    plan = self._parse_file(file_path, fast_parse)
+                except Exception as e:
+                    stats['errors'].append(file_path.name)
+                    logger.error(f"Error parsing {file_path}: {e}")
+                    continue
+                if record(file_path, cache_key, plan):
+                    yield index, plan
+        else:
+            max_workers = min(max_workers or os.cpu_count() or 1, len(to_parse))
+            pending = {}
+            
+            def collect(done):
+                for future in done:
+                    index, file_path, cache_key = pending.pop(future)
+                    try:
+                        plan = future.result()
+                    except Exception as e:
+                        stats['errors'].append(file_path.name)
+                        logger.error(f"Error parsing {file_path}: {e}")
+                        continue
+                    if record(file_path, cache_key, plan):
+                        yield index, plan
+            
+            # A fresh pool per batch; its workers exit at the end of the batch
+            # and release whatever the PDF libraries accumulated. (This also
+            # works on Pythons without max_tasks_per_child and keeps fork.)
+            batch_size = PARSE_TASKS_PER_WORKER * max_workers
+            for start in range(0, len(to_parse), batch_size):
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parse_worker) as executor:
+                    for index, file_path, cache_key in to_parse[start:start + batch_size]:
+                        if len(pending) >= MAX_PENDING_PARSES:
+                            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                            yield from collect(done)
+                        future = executor.submit(_parse_in_worker, str(file_path), fast_parse)
+                        pending[future] = (index, file_path, cache_key)
+                    
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from collect(done)
+    
+    def _parse_file(self, file_path: Path, fast_parse: bool = False) -> Optional[Plan]:
+        """Parse one plan document with the configured strategy."""
+        if fast_parse:
+            return self.parser.parse_document_fast(str(file_path))
+        return self.parser.parse_document(str(file_path))
+    
+    def _parse_file_cached(self, file_path: Path, fast_parse: bool = False) -> Optional[Plan]:
+        """Parse one plan document, reusing a cached result for unchanged content."""
+        cache_key = self._plan_cache_key(file_path, fast_parse)
+        plan = self._load_cached_plan(cache_key)
+        if plan is None:
+            plan = self._parse_file(file_path, fast_parse)
+            if plan:
+                self._store_cached_plan(cache_key, plan)
+        return plan
+    
+    def _plan_cache_key(self, file_path: Path, fast_parse: bool = False) -> Optional[str]:
+        """
+        Build the plan cache key from the file's content hash.
+        
+        Hashing content rather than mtime means re-downloaded but unchanged
+        documents still hit. The parse strategy and cache version are part
+        of the key because they change the resulting Plan. Digests are
+        remembered per (path, mtime, size), so warm runs over an unchanged
+        directory only stat each file instead of reading it.
+        """
+        if not self.use_plan_cache:
+            return None
+        
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        
+        digests = self._get_plan_cache_digests()
+        path_key = str(file_path.resolve())
+        entry = digests.get(path_key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            digest = entry[2]
+        else:
+            hasher = hashlib.blake2b(digest_size=16)
+            try:
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        hasher.update(chunk)
+            except OSError:
+                return None
+            digest = hasher.hexdigest()
+            digests[path_key] = [stat.st_mtime_ns, stat.st_size, digest]
+        
+        strategy = 'fast' if fast_parse else 'full'
+        return f"{digest}_v{PLAN_CACHE_VERSION}_{strategy}"
+    
+    def _get_plan_cache_counts(self) -> Dict[str, int]:
+        """Load the cache's access-count index on first use."""
+        if self._plan_cache_counts is None:
+            index_file = self._plan_cache_dir / "index.json"
+            self._plan_cache_counts = {}
+            if index_file.exists():
+                try:
+                    with open(index_file, 'r') as f:
+                        self._plan_cache_counts = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Ignoring unreadable plan cache index: {e}")
+        return self._plan_cache_counts
+    
+    def _get_plan_cache_digests(self) -> Dict[str, List]:
+        """Load the path -> [mtime_ns, size, digest] index on first use."""
+        if self._plan_cache_digests is None:
+            digests_file = self._plan_cache_dir / "digests.json"
+            self._plan_cache_digests = {}
+            if digests_file.exists():
+                try:
+                    with open(digests_file, 'r') as f:
+                        self._plan_cache_digests = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Ignoring unreadable plan cache digests: {e}")
+        return self._plan_cache_digests
+    
+    def _load_cached_plan(self, cache_key: Optional[str]) -> Optional[Plan]:
+        """
+        Return the cached Plan for a key, or None on a miss.
+        
+        Entries are unpickled, which can run arbitrary code: the cache
+        directory is trusted to contain only what _store_cached_plan wrote.
+        """
+        if cache_key is None:
+            return None
+        
+        cache_file = self._plan_cache_dir / f"{cache_key}.pkl"
+        if not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                plan = pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cached plan {cache_file.name}: {e}")
+            return None
+        
+        counts = self._get_plan_cache_counts()
+        counts[cache_key] = counts.get(cache_key, 0) + 1
+        return plan
+    
+    def _store_cached_plan(self, cache_key: Optional[str], plan: Plan):
+        """Write a parsed Plan to the cache."""
+        if cache_key is None:
+            return
+        
+        try:
+            self._plan_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._plan_cache_dir / f"{cache_key}.pkl", 'wb') as f:
+                pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not cache parsed plan: {e}")
+            return
+        
+        counts = self._get_plan_cache_counts()
+        counts[cache_key] = counts.get(cache_key, 0) + 1
+    
+    def _save_plan_cache_index(self):
+        """
+        Persist access counts and file digests, evicting the least-used
+        entries over the limit.
+        
+        Digests are pruned to those of plans still in the cache, so the
+        digest index stays bounded along with it.
+        """
+        digests = self._plan_cache_digests
+        counts = self._plan_cache_counts
+        if not counts and not digests:
+            return
+        counts = self._get_plan_cache_counts()
+        
+        if len(counts) > PLAN_CACHE_MAX_ENTRIES:
+            evicted = sorted(counts, key=counts.get)[:len(counts) - PLAN_CACHE_MAX_ENTRIES]
+            for cache_key in evicted:
+                try:
+                    (self._plan_cache_dir / f"{cache_key}.pkl").unlink()
+                except FileNotFoundError:
+                    pass
+                del counts[cache_key]
+        
+        try:
+            self._plan_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._plan_cache_dir / "index.json", 'w') as f:
+                json.dump(counts, f)
+        except OSError as e:
+            logger.debug(f"Could not write plan cache index: {e}")
+        
+        if digests is not None:
+            # Cache keys are "{digest}_v{version}_{strategy}"
+            live = {cache_key.split('_', 1)[0] for cache_key in counts}
+            for path_key in [path_key for path_key, entry in digests.items() if entry[2] not in live]:
+                del digests[path_key]
+            try:
+                with open(self._plan_cache_dir / "digests.json", 'w') as f:
+                    json.dump(digests, f)
+            except OSError as e:
+                logger.debug(f"Could not write plan cache digests: {e}")
+    
     def _fetch_healthcare_gov_plans(self) -> List[Plan]:
         """
         Fetch plans from Healthcare.gov API with CMS fallback.
@@ -221,6 +729,7 @@ class HealthPlanAnalyzer:
         - Falls back to CMS public data if API key not available
         - Implements caching to reduce API calls
         - Handles rate limiting with exponential backoff
+        - Searches each metal level shard concurrently
         
         Returns:
             List of plans from Healthcare.gov or CMS public data
@@ -245,29 +754,82 @@ class HealthPlanAnalyzer:
             
             # Fetch plans using Healthcare.gov API or CMS fallback
             # API automatically handles authentication and fallback
-            plans_data = self.healthcare_gov_api.fetch_plans(
-                zipcode=validated_zipcode,
-                metal_levels=['Bronze', 'Silver', 'Gold', 'Platinum'],
-                plan_types=['HMO', 'PPO', 'EPO', 'POS']
-            )
-            
-            # Convert API response to Plan objects
-            plans = []
-            for plan_data in plans_data.get('plans', []):
-                try:
-                    plan = self._convert_api_plan(plan_data)
-                    if plan:
-                        plans.append(plan)
-                except Exception as e:
-                    logger.error(f"Error converting API plan: {e}")
-                    continue
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._fetch_healthcare_gov_plans_async(validated_zipcode))
             
-            return plans
+            # Already inside an event loop (e.g. a notebook): run the fetch on
+            # its own loop in a helper thread instead of nesting loops. The
+            # coroutine is created on that thread so it is always awaited.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    lambda: asyncio.run(self._fetch_healthcare_gov_plans_async(validated_zipcode))
+                ).result()
             
         except Exception as e:
             logger.error(f"Error fetching Healthcare.gov plans: {e}")
             return []
     
+    async def _fetch_healthcare_gov_plans_async(self, zipcode: str) -> List[Plan]:
+        """
+        Fetch every metal level shard concurrently.
+        
+        A failed shard is logged and skipped rather than failing the whole
+        fetch. Raw API records are converted in the loop's executor so the
+        conversion does not stall the other in-flight requests.
+        
+        Args:
+            zipcode: Validated 5-digit ZIP code
+        
+        Returns:
+            Plans from all shards, de-duplicated by plan_id
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(self.healthcare_gov_api.fetch_plans_async(
+                zipcode=zipcode,
+                metal_levels=[metal_level],
+                plan_types=HEALTHCARE_GOV_PLAN_TYPES
+            ) for metal_level in HEALTHCARE_GOV_METAL_LEVELS),
+            return_exceptions=True
+        )
+        
+        plans = []
+        seen_ids = set()
+        for metal_level, result in zip(HEALTHCARE_GOV_METAL_LEVELS, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {metal_level} plans: {result}")
+                continue
+            
+            # The API client returns Plan objects; a raw response payload
+            # (e.g. from a substituted client) still needs converting
+            if isinstance(result, dict):
+                result = await loop.run_in_executor(
+                    None, self._convert_api_plans, result.get('plans', [])
+                )
+            
+            for plan in result:
+                if plan.plan_id not in seen_ids:
+                    seen_ids.add(plan.plan_id)
+                    plans.append(plan)
+        
+        return plans
+    
+    def _convert_api_plans(self, plans_data: List[Dict[str, Any]]) -> List[Plan]:
+        """Convert raw Healthcare.gov plan records, skipping any that fail."""
+        # Filter malformed records up front: one summary warning instead of
+        # raising and logging inside the conversion for each bad record
+        valid = [plan_data for plan_data in plans_data if self._validate_api_plan(plan_data)]
+        skipped = len(plans_data) - len(valid)
+        if skipped:
+            logger.warning(f"Skipped {skipped} malformed Healthcare.gov plans")
+        
+        plans = [plan for plan in map(self._convert_api_plan, valid) if plan is not None]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Converted {len(plans)} of {len(plans_data)} API plans")
+        return plans
+    
     def _generate_reports(self, report: AnalysisReport, formats: List[str]) -> Dict[str, Path]:
         """
         Generate reports in requested formats.
@@ -286,37 +848,63 @@ class HealthPlanAnalyzer:
         Returns:
             Dictionary mapping format to generated file path
         """
-        generated = {}  # Track generated file paths
-        
-        # Generate executive summary (Markdown format)
-        if 'summary' in formats or 'all' in formats:
-            summary = self.report_generator.generate_executive_summary(report)
-            summary_file = self.output_dir / f"executive_summary_{report.generated_at.strftime('%Y%m%d_%H%M%S')}.md"
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(summary)
-            generated['summary'] = summary_file
-            logger.info(f"Generated executive summary: {summary_file}")
-        
-        # Generate CSV scoring matrix for spreadsheet analysis
-        if 'csv' in formats or 'all' in formats:
-            csv_file = self.report_generator.generate_scoring_matrix_csv(report)
-            generated['csv'] = Path(csv_file)
-            logger.info(f"Generated CSV matrix: {csv_file}")
-        
-        # Generate JSON export for API integration
-        if 'json' in formats or 'all' in formats:
-            json_file = self.report_generator.generate_json_export(report)
-            generated['json'] = Path(json_file)
-            logger.info(f"Generated JSON export: {json_file}")
-        
-        # Generate interactive HTML dashboard
-        if 'html' in formats or 'all' in formats:
-            html_file = self.report_generator.generate_html_dashboard(report)
-            generated['html'] = Path(html_file)
-            logger.info(f"Generated HTML dashboard: {html_file}")
+        requested = set(formats)
+        wants_all = 'all' in requested
+        unknown = requested - REPORT_FORMATS - {'all'}
+        if unknown:
+            logger.warning(f"Ignoring unknown report formats: {', '.join(sorted(unknown))}")
+        
+        # Shared filename timestamp, formatted once per report
+        timestamp = report.generated_at.strftime('%Y%m%d_%H%M%S')
+        
+        # Writers for each format; they touch separate files, so they run
+        # side by side rather than back to back
+        writers = {
+            'summary': functools.partial(self._write_executive_summary, timestamp=timestamp),  # Markdown executive summary
+            'csv': self._write_scoring_matrix,         # Spreadsheet analysis
+            'json': self._write_json_export,           # API integration
+            'html': self._write_html_dashboard,        # Interactive dashboard
+        }
+        tasks = {name: writer for name, writer in writers.items()
+                 if wants_all or name in requested}
+        if not tasks:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(writer, report) for name, writer in tasks.items()}
+            generated = {name: future.result() for name, future in futures.items()}
         
         return generated
     
+    def _write_executive_summary(self, report: AnalysisReport, timestamp: Optional[str] = None) -> Path:
+        """Write the Markdown executive summary."""
+        if timestamp is None:
+            timestamp = report.generated_at.strftime('%Y%m%d_%H%M%S')
+        summary = self.report_generator.generate_executive_summary(report)
+        summary_file = self.output_dir / f"executive_summary_{timestamp}.md"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(summary)
+        logger.info(f"Generated executive summary: {summary_file}")
+        return summary_file
+    
+    def _write_scoring_matrix(self, report: AnalysisReport) -> Path:
+        """Write the CSV scoring matrix."""
+        csv_file = self.report_generator.generate_scoring_matrix_csv(report)
+        logger.info(f"Generated CSV matrix: {csv_file}")
+        return Path(csv_file)
+    
+    def _write_json_export(self, report: AnalysisReport) -> Path:
+        """Write the JSON export."""
+        json_file = self.report_generator.generate_json_export(report)
+        logger.info(f"Generated JSON export: {json_file}")
+        return Path(json_file)
+    
+    def _write_html_dashboard(self, report: AnalysisReport) -> Path:
+        """Write the HTML dashboard."""
+        html_file = self.report_generator.generate_html_dashboard(report)
+        logger.info(f"Generated HTML dashboard: {html_file}")
+        return Path(html_file)
+    
     def analyze_single_plan(self, client: Client, plan: Plan) -> Dict[str, Any]:
         """
         Analyze a single plan for quick assessment.
@@ -337,37 +925,60 @@ class HealthPlanAnalyzer:
             - Strengths and concerns
             - Overall weighted score
         """
-        # Run 6-metric scoring on single plan
-        analysis = self.engine.scorer.score_plan(client, plan, [plan])
+        return self.analyze_plans_batch(client, [plan])[0]
+    
+    def analyze_plans_batch(self, client: Client, plans: List[Plan]) -> List[Dict[str, Any]]:
+        """
+        Analyze several plans in one scoring pass.
         
-        # Package results in structured format
-        return {
-            # Basic plan information
-            'plan_name': plan.marketing_name,
-            'issuer': plan.issuer,
-            'metal_level': plan.metal_level.value,
-            'monthly_premium': plan.monthly_premium,
-            
-            # Cost analysis
-            'estimated_annual_cost': analysis.estimated_annual_cost,
-            
-            # Overall score (weighted combination of 6 metrics)
-            'overall_score': analysis.metrics.weighted_total_score,
-            
-            # Individual metric scores (0-10 scale)
-            'metrics': {
-                'provider_network': analysis.metrics.provider_network_score,      # 30% weight
-                'medication_coverage': analysis.metrics.medication_coverage_score, # 25% weight
-                'total_cost': analysis.metrics.total_cost_score,                 # 20% weight
-                'financial_protection': analysis.metrics.financial_protection_score, # 10% weight
-                'administrative_simplicity': analysis.metrics.administrative_simplicity_score, # 10% weight
-                'plan_quality': analysis.metrics.plan_quality_score              # 5% weight
-            },
+        Prefer this over calling analyze_single_plan in a loop: the engine
+        runs once for the whole batch, and each plan is scored against the
+        other plans in the batch rather than on its own.
+        
+        Args:
+            client: Client profile with priorities and requirements
+            plans: Plans to analyze
+        
+        Returns:
+            One analyze_single_plan-style dictionary per plan, in input order
+        """
+        # Run 6-metric scoring on the batch; input order is kept
+        report = self.engine.analyze_plans(client, plans, full_rank=False)
+        
+        results = []
+        for analysis in report.plan_analyses:
+            plan = analysis.plan
             
-            # Qualitative assessment
-            'strengths': self.engine._identify_plan_strengths(analysis),
-            'concerns': self.engine._identify_plan_concerns(analysis)
-        }
+            # Package results in structured format
+            results.append({
+                # Basic plan information
+                'plan_name': plan.marketing_name,
+                'issuer': plan.issuer,
+                'metal_level': plan.metal_level.value,
+                'monthly_premium': plan.monthly_premium,
+                
+                # Cost analysis
+                'estimated_annual_cost': analysis.estimated_annual_cost,
+                
+                # Overall score (weighted combination of 6 metrics)
+                'overall_score': analysis.metrics.weighted_total_score,
+                
+                # Individual metric scores (0-10 scale)
+                'metrics': {
+                    'provider_network': analysis.metrics.provider_network_score,      # 30% weight
+                    'medication_coverage': analysis.metrics.medication_coverage_score, # 25% weight
+                    'total_cost': analysis.metrics.total_cost_score,                 # 20% weight
+                    'financial_protection': analysis.metrics.financial_protection_score, # 10% weight
+                    'administrative_simplicity': analysis.metrics.administrative_simplicity_score, # 10% weight
+                    'plan_quality': analysis.metrics.plan_quality_score              # 5% weight
+                },
+                
+                # Qualitative assessment
+                'strengths': self.engine._identify_plan_strengths(analysis),
+                'concerns': self.engine._identify_plan_concerns(analysis)
+            })
+        
+        return results
     
     def get_scoring_matrix(self, report: AnalysisReport) -> List[Dict]:
         """
@@ -404,6 +1015,10 @@ class HealthPlanAnalyzer:
         """
         return self.engine.generate_comparison_summary(report)
     
+    def _validate_api_plan(self, api_data: Any) -> bool:
+        """Check that a raw API plan record has the fields conversion relies on."""
+        return isinstance(api_data, dict) and all(field in api_data for field in self._REQUIRED_API_FIELDS)
+    
     def _convert_api_plan(self, api_data: Dict[str, Any]) -> Optional[Plan]:
         """
         Convert Healthcare.gov API response to Plan model.
@@ -418,22 +1033,30 @@ class HealthPlanAnalyzer:
             api_data: Raw API response for a single plan
         
         Returns:
-            Plan object or None if conversion fails
+            Plan object or None if conversion fails (including a missing or
+            unrecognized metal level or plan type, rather than guessing one)
         """
         try:
+            metal_level = self._METAL_MAP.get(str(api_data.get('metal_level', '')).upper())
+            plan_type = self._PLAN_TYPE_MAP.get(str(api_data.get('plan_type', '')).upper())
+            if metal_level is None or plan_type is None:
+                logger.warning(
+                    "Skipping Healthcare.gov plan %s: unrecognized metal level %r or plan type %r",
+                    api_data.get('plan_id'), api_data.get('metal_level'), api_data.get('plan_type')
+                )
+                return None
+            
             # Implementation would map API fields to Plan model
             # This is a simplified placeholder
-            from .core.models import Plan, MetalLevel, PlanType
-            
             plan = Plan(
                 plan_id=api_data.get('plan_id', ''),
                 marketing_name=api_data.get('plan_marketing_name', ''),
                 issuer=api_data.get('issuer_name', ''),
-                metal_level=MetalLevel(api_data.get('metal_level', 'Bronze').upper()),
-                plan_type=PlanType(api_data.get('plan_type', 'HMO').upper()),
+                metal_level=metal_level,
+                plan_type=plan_type,
                 monthly_premium=float(api_data.get('premium', 0)),
                 deductible=float(api_data.get('medical_deductible', 0)),
-                out_of_pocket_max=float(api_data.get('medical_moop', 0)),
+                oop_max=float(api_data.get('medical_moop', 0)),
                 # Additional fields would be mapped here
             )
             return plan
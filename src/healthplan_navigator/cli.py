@@ -9,10 +9,7 @@ import json
 from pathlib import Path
 from typing import Optional
 
-from .core.ingest import DocumentParser
 from .core.models import Client, PersonalInfo, MedicalProfile, Priorities, Provider, Medication, Priority
-from .analysis.engine import AnalysisEngine
-from .output.report import ReportGenerator
 
 
 def create_sample_client() -> Client:
@@ -185,6 +182,11 @@ Examples:
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help and usage errors don't pay
+    # for pdfplumber, python-docx and the report stack
+    from .core.ingest import DocumentParser
+    from .analysis.engine import AnalysisEngine
+    
     # Load client data
     if args.sample_client:
         client = create_sample_client()
@@ -233,6 +235,7 @@ Examples:
     print(f"Overall score: {report.top_recommendations[0].metrics.weighted_total_score:.1f}/10")
     
     # Generate reports
+    from .output.report import ReportGenerator
     report_gen = ReportGenerator(args.output)
     generated_files = []
     
@@ -1,7 +1,12 @@
+import asyncio
+import functools
+import io
 import json
 import csv
+import os
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import pdfplumber
@@ -11,17 +16,171 @@ from .models import Plan, MetalLevel, PlanType, CoverageStatus, NetworkStatus, C
 logger = logging.getLogger(__name__)
 
 
+def _compile_patterns(*patterns: str):
+    """Compile patterns once, keeping their priority order."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def _lowercase_text(text: str) -> str:
+    """
+    Case-fold text for the extraction patterns, keeping character offsets.
+    
+    The patterns are lowercase and case-sensitive, which is cheaper than
+    IGNORECASE; offsets must line up so values can be sliced from the
+    original text. The rare characters whose folded form is longer than one
+    character keep the first character of their lowercase form.
+    """
+    lowered = text.casefold()
+    if len(lowered) != len(text):
+        lowered = ''.join(ch.casefold() if len(ch.casefold()) == 1 else ch.lower()[:1] for ch in text)
+    return lowered
+
+
+# Field extraction patterns for Healthcare.gov PDFs, tried in order (first
+# match wins). Compiled at import so parsing a batch does no regex setup.
+# They are matched against lowercased text (see _lowercase_text).
+_PLAN_ID_PATTERNS = _compile_patterns(
+    r'plan id[:\s]+([0-9]+az[0-9]+)',
+    r'([0-9]{5,}az[0-9]{4,})',
+    r'plan id[:\s]+([a-z0-9]+)',
+    r'id#?\s*([0-9]{6,})',
+)
+
+_ISSUER_PATTERNS = _compile_patterns(
+    r'(ambetter from arizona complete health)',
+    r'(ambetter)',
+    r'(blue cross blue shield of arizona)',
+    r'(blue cross blue shield)',
+    r'(unitedhealthcare)',
+    r'(unitedhealth)',
+    r'(banner health)',
+    r'(oscar health)',
+    r'(aetna)',
+    r'(cigna)',
+    r'(humana)',
+    r'(imperial)',
+)
+
+_MARKETING_NAME_PATTERNS = _compile_patterns(
+    r'((?:standard\s+)?(?:gold|silver|bronze|platinum)[^|]*?)(?:\s*\|)',
+    r'(blue aca[^|]+)',
+    r'plan name[:\s]+([^\n]+)',
+)
+
+_PREMIUM_PATTERNS = _compile_patterns(
+    r'monthly premium\s*\$([0-9]+(?:\.[0-9]{2})?)',
+    r'premium\s*\$([0-9]+(?:\.[0-9]{2})?)\s*(?:/month|per month)?',
+    r'\$([0-9]+(?:\.[0-9]{2})?)\s*/month',
+    r'was\s*\$([0-9]+(?:\.[0-9]{2})?)',  # Original premium before tax credit
+)
+
+_DEDUCTIBLE_PATTERNS = _compile_patterns(
+    r'deductible\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*individual',
+    r'deductible\s*\$([0-9,]+(?:\.[0-9]{2})?)',
+    r'individual deductible[:\s]*\$([0-9,]+(?:\.[0-9]{2})?)',
+)
+
+_OOP_MAX_PATTERNS = _compile_patterns(
+    r'out-of-pocket maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*individual',
+    r'out-of-pocket maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)',
+    r'maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*individual',
+)
+
+_PCP_COPAY_PATTERNS = _compile_patterns(
+    r'primary care visit[:\s]*\$([0-9]+)',
+    r'pcp[:\s]*\$([0-9]+)',
+    r'doctor visit[:\s]*\$([0-9]+)',
+)
+
+_SPECIALIST_COPAY_PATTERNS = _compile_patterns(
+    r'specialist visit[:\s]*\$([0-9]+)',
+    r'specialist[:\s]*\$([0-9]+)',
+)
+
+_ER_COPAY_PATTERNS = _compile_patterns(
+    r'emergency room[:\s]*\$([0-9]+)',
+    r'er visit[:\s]*\$([0-9]+)',
+    r'emergency[:\s]*\$([0-9]+)',
+)
+
+_REFERRAL_PATTERN = re.compile(r'referral.*(required|needed)')
+_PRIOR_AUTH_PATTERN = re.compile(r'prior auth')
+
+_FILENAME_ID_PATTERN = re.compile(r'([0-9]{6,})')
+_NON_ID_CHARS = re.compile(r'[^A-Z0-9]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Columns _csv_row_to_plan reads; parse_csv materializes only these per row
+_CSV_PLAN_FIELDS = (
+    'plan_id', 'issuer', 'marketing_name', 'metal_level', 'plan_type',
+    'monthly_premium', 'deductible', 'deductible_individual', 'oop_max',
+    'oop_max_individual', 'copay_primary', 'copay_specialist', 'copay_er',
+    'coinsurance', 'requires_referrals', 'quality_rating', 'customer_rating',
+)
+
+# Keyword tables for the substring checks. Plain `in` tests run at memory
+# speed, so a handful of them beats any single-pass multi-keyword regex.
+_FILENAME_ISSUERS = (
+    ('amb', 'Ambetter'),
+    ('bcbs', 'Blue Cross Blue Shield'),
+    ('uhc', 'UnitedHealthcare'),
+    ('banner', 'Banner Health'),
+    ('imperial', 'Imperial Health'),
+    ('oscar', 'Oscar Health'),
+)
+
+# Highest tier first: the first metal found in the text or filename wins
+_METAL_LEVEL_ORDER = ('platinum', 'gold', 'silver', 'bronze', 'catastrophic')
+
+# Metal names (case-sensitive, first found wins) for filename-built plan names
+_FILENAME_NAME_METALS = ('Gold', 'Silver', 'Bronze')
+
+
+# Per-process parser used by batch parsing pools (here and in the analyzer)
+_worker_parser = None
+
+
+def _init_parse_worker():
+    """Create one DocumentParser per worker process."""
+    global _worker_parser
+    _worker_parser = DocumentParser()
+
+
+def _parse_in_worker(file_path: str, fast: bool = False) -> Optional[Plan]:
+    """Parse a single plan document inside a worker process."""
+    if fast:
+        return _worker_parser.parse_document_fast(file_path)
+    return _worker_parser.parse_document(file_path)
+
+
 class DocumentParser:
     """Handles parsing of healthcare plan documents in various formats."""
     
-    def __init__(self):
-        self.metal_level_mapping = {
-            'bronze': MetalLevel.BRONZE,
-            'silver': MetalLevel.SILVER,
-            'gold': MetalLevel.GOLD,
-            'platinum': MetalLevel.PLATINUM,
-            'catastrophic': MetalLevel.CATASTROPHIC
-        }
+    # File extensions handled by parse_document / parse_batch
+    SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.json', '.csv'})
+    
+    # Minimum first-page text length for the fast PDF path to be trusted
+    FAST_PATH_MIN_TEXT = 200
+    
+    # parse_batch only starts a process pool from this many files upwards;
+    # below it, pool startup costs more than it saves
+    PARALLEL_BATCH_MIN_FILES = 3
+    
+    # Files parse_batch_async reads at once (bounds open file descriptors)
+    ASYNC_BATCH_CONCURRENCY = 32
+    
+    # Documents up to this size are read into memory before parsing; larger
+    # ones are opened by path so a pathological input cannot exhaust memory
+    MAX_BUFFERED_FILE_BYTES = 200 * 1024 * 1024
+    
+    METAL_LEVEL_MAPPING = {
+        'bronze': MetalLevel.BRONZE,
+        'silver': MetalLevel.SILVER,
+        'gold': MetalLevel.GOLD,
+        'platinum': MetalLevel.PLATINUM,
+        'catastrophic': MetalLevel.CATASTROPHIC
+    }
+    metal_level_mapping = METAL_LEVEL_MAPPING  # Backwards compatibility
     
     def parse_document(self, file_path: str) -> Optional[Plan]:
         """Parse a document and extract plan information."""
@@ -39,48 +198,196 @@ class DocumentParser:
         else:
             raise ValueError(f"Unsupported file format: {path.suffix}")
     
-    def parse_batch(self, directory_path: str) -> List[Plan]:
-        """Parse all supported documents in a directory."""
+    def parse_document_fast(self, file_path: str) -> Optional[Plan]:
+        """
+        Parse a document, trying a cheap first-page PDF extraction first.
+        
+        Healthcare.gov plan PDFs carry the premium, deductible and OOP max on
+        the first page, so the full multi-page extraction only runs when the
+        first page yields too little text or misses those cost fields. Other
+        formats go straight to parse_document.
+        """
+        if Path(file_path).suffix.lower() != '.pdf':
+            return self.parse_document(file_path)
+        
+        plan = self._parse_pdf_first_page(file_path)
+        if plan is not None:
+            logger.debug("strategy=fast %s", file_path)
+            return plan
+        
+        logger.debug("strategy=full %s", file_path)
+        return self._parse_pdf(file_path)
+    
+    def parse_metadata(self, file_path: str) -> Optional[Plan]:
+        """
+        Identify a plan document from its filename without extracting text.
+        
+        For PDF and DOCX files whose name carries both a known issuer and a
+        metal level, returns a Plan with plan ID, issuer, metal level and
+        marketing name resolved from the filename and cost fields left at 0;
+        otherwise None. Use it when only the structural metadata is needed,
+        e.g. to list a directory - scoring needs parse_document's costs.
+        JSON and CSV files carry their fields directly and go through
+        parse_document.
+        """
+        path = Path(file_path)
+        if path.suffix.lower() not in ('.pdf', '.docx'):
+            return self.parse_document(file_path)
+        
+        stem_lower = path.stem.lower()
+        if not any(metal in stem_lower for metal in _METAL_LEVEL_ORDER):
+            return None
+        if self._extract_issuer_from_filename(file_path) == 'Unknown Issuer':
+            return None
+        
+        # With no text every extractor takes its filename fallback
+        return self._extract_plan_from_text("", file_path)
+    
+    def parse_batch(self, directory_path: str, fast: bool = False,
+                    max_workers: Optional[int] = None,
+                    metadata_only: bool = False) -> List[Plan]:
+        """
+        Parse all supported documents in a directory.
+        
+        With fast=True, PDFs go through parse_document_fast. Files are
+        independent and PDF extraction is CPU-bound, so batches of at least
+        PARALLEL_BATCH_MIN_FILES are parsed in a process pool (pass
+        max_workers=1 to stay in-process). Plans keep directory order.
+        
+        With metadata_only=True, documents go through parse_metadata
+        in-process instead, skipping text extraction entirely.
+        """
+        directory = Path(directory_path)
+        candidates = [file_path for file_path in directory.glob("*")
+                      if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS]
+        
+        return self._collect_batch(self._parse_files(candidates, fast, max_workers, metadata_only))
+    
+    def _collect_batch(self, outcomes) -> List[Plan]:
+        """Log (file_path, plan, error) parse outcomes and keep the plans."""
         plans = []
+        for file_path, plan, error in outcomes:
+            if error is not None:
+                logger.error(f"Error parsing {file_path}: {error}")
+                # Continue processing other files rather than failing completely
+            elif plan:
+                plans.append(plan)
+                logger.debug("Successfully parsed plan from %s", file_path.name)
+            else:
+                logger.warning(f"No plan data extracted from {file_path.name}")
+        
+        return plans
+    
+    async def parse_batch_async(self, directory_path: str, fast: bool = False,
+                                max_concurrency: Optional[int] = None) -> List[Plan]:
+        """
+        Awaitable parse_batch for callers already running an event loop.
+        
+        Directory listing and each file parse run in the loop's default
+        executor, at most max_concurrency (ASYNC_BATCH_CONCURRENCY) files at
+        a time, so reads of many small JSON/CSV/DOCX files overlap without
+        blocking the loop. Logging and result order match parse_batch.
+        """
+        loop = asyncio.get_running_loop()
         directory = Path(directory_path)
+        paths = await loop.run_in_executor(None, lambda: list(directory.glob("*")))
+        candidates = [file_path for file_path in paths
+                      if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS]
+        
+        parse = self.parse_document_fast if fast else self.parse_document
+        semaphore = asyncio.Semaphore(max_concurrency or self.ASYNC_BATCH_CONCURRENCY)
+        
+        async def parse_one(file_path: Path):
+            async with semaphore:
+                return await loop.run_in_executor(None, functools.partial(parse, str(file_path)))
         
-        for file_path in directory.glob("*"):
-            if file_path.suffix.lower() in ['.pdf', '.docx', '.json', '.csv']:
+        results = await asyncio.gather(*(parse_one(file_path) for file_path in candidates),
+                                       return_exceptions=True)
+        
+        return self._collect_batch(
+            (file_path, None, result) if isinstance(result, Exception) else (file_path, result, None)
+            for file_path, result in zip(candidates, results)
+        )
+    
+    def _parse_files(self, candidates: List[Path], fast: bool = False,
+                     max_workers: Optional[int] = None, metadata_only: bool = False):
+        """Yield (file_path, plan, error) for each candidate, in order."""
+        if metadata_only or len(candidates) < self.PARALLEL_BATCH_MIN_FILES or max_workers == 1:
+            if metadata_only:
+                parse = self.parse_metadata
+            else:
+                parse = self.parse_document_fast if fast else self.parse_document
+            for file_path in candidates:
                 try:
-                    plan = self.parse_document(str(file_path))
-                    if plan:
-                        plans.append(plan)
-                        logger.info(f"Successfully parsed plan from {file_path.name}")
-                    else:
-                        logger.warning(f"No plan data extracted from {file_path.name}")
+                    yield file_path, parse(str(file_path)), None
                 except Exception as e:
-                    logger.error(f"Error parsing {file_path}: {e}")
-                    # Continue processing other files rather than failing completely
+                    yield file_path, None, e
+            return
         
-        return plans
+        max_workers = min(max_workers or os.cpu_count() or 1, len(candidates))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parse_worker) as executor:
+            futures = [executor.submit(_parse_in_worker, str(file_path), fast) for file_path in candidates]
+            for file_path, future in zip(candidates, futures):
+                try:
+                    yield file_path, future.result(), None
+                except Exception as e:
+                    yield file_path, None, e
+    
+    def _open_buffered(self, file_path: str):
+        """
+        Return the document as an in-memory stream, or the path if too large.
+        
+        pdfplumber and python-docx issue many small seeks and reads; serving
+        them from a BytesIO avoids a syscall per read, which matters most on
+        network filesystems.
+        """
+        if os.path.getsize(file_path) > self.MAX_BUFFERED_FILE_BYTES:
+            return file_path
+        with open(file_path, 'rb') as fh:
+            return io.BytesIO(fh.read())
     
     def _parse_pdf(self, file_path: str) -> Optional[Plan]:
         """Extract plan information from PDF documents."""
         try:
-            with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text
+            with pdfplumber.open(self._open_buffered(file_path)) as pdf:
+                text = "".join(page.extract_text() or "" for page in pdf.pages)
                 
                 return self._extract_plan_from_text(text, file_path)
         except Exception as e:
             logger.error(f"Error reading PDF {file_path}: {e}")
             return None
     
+    def _parse_pdf_first_page(self, file_path: str) -> Optional[Plan]:
+        """
+        Extract plan information from the first PDF page only.
+        
+        Returns None when the page has too little text or the premium,
+        deductible and OOP max could not all be found, signalling that the
+        full document should be parsed instead.
+        """
+        try:
+            with pdfplumber.open(self._open_buffered(file_path)) as pdf:
+                if not pdf.pages:
+                    return None
+                text = pdf.pages[0].extract_text() or ""
+        except Exception as e:
+            logger.debug(f"Fast PDF extraction failed for {file_path}: {e}")
+            return None
+        
+        if len(text.strip()) < self.FAST_PATH_MIN_TEXT:
+            return None
+        
+        plan = self._extract_plan_from_text(text, file_path)
+        if not (plan.monthly_premium and plan.deductible and plan.oop_max):
+            return None
+        
+        return plan
+    
     def _parse_docx(self, file_path: str) -> Optional[Plan]:
         """Extract plan information from DOCX documents."""
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            doc = Document(self._open_buffered(file_path))
+            text = "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
             
             return self._extract_plan_from_text(text, file_path)
         except Exception as e:
@@ -104,9 +411,23 @@ class DocumentParser:
         plans = []
         try:
             with open(file_path, 'r') as f:
-                reader = csv.DictReader(f)
+                # csv.reader plus a header index map, building each row dict
+                # from just the plan columns instead of a DictReader dict of
+                # every column. Same semantics: blank lines are skipped, a
+                # repeated header name takes its last column, and columns
+                # missing from a short row read as None.
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = {name: index for index, name in enumerate(header)}
+                fields = [(name, columns[name]) for name in _CSV_PLAN_FIELDS if name in columns]
+                width = len(header)
+                
                 for row in reader:
-                    plan = self._csv_row_to_plan(row)
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [None] * (width - len(row))
+                    plan = self._csv_row_to_plan({name: row[index] for name, index in fields})
                     if plan:
                         plans.append(plan)
             return plans
@@ -119,35 +440,36 @@ class DocumentParser:
         
         # Clean text for better matching
         text = text.replace('\n', ' ')  # Join lines for multi-line patterns
+        text_lower = _lowercase_text(text)  # Shared by every extractor below
         
         # Extract plan ID - Healthcare.gov format
-        plan_id = self._extract_plan_id_fixed(text, source_file)
+        plan_id = self._extract_plan_id_fixed(text, source_file, text_lower)
         
         # Extract issuer/company name
-        issuer = self._extract_issuer_fixed(text, source_file)
+        issuer = self._extract_issuer_fixed(text, source_file, text_lower)
         
         # Extract metal level
-        metal_level = self._extract_metal_level_fixed(text, source_file)
+        metal_level = self._extract_metal_level_fixed(text, source_file, text_lower)
         
         # Extract marketing name
-        marketing_name = self._extract_marketing_name_fixed(text, source_file)
+        marketing_name = self._extract_marketing_name_fixed(text, source_file, text_lower)
         
         # Extract costs with FIXED patterns
-        monthly_premium = self._extract_premium_fixed(text)
-        deductible = self._extract_deductible_fixed(text)
-        oop_max = self._extract_oop_max_fixed(text)
+        monthly_premium = self._extract_premium_fixed(text, text_lower)
+        deductible = self._extract_deductible_fixed(text, text_lower)
+        oop_max = self._extract_oop_max_fixed(text, text_lower)
         
         # Extract cost sharing
-        cost_sharing = self._extract_cost_sharing_fixed(text)
+        cost_sharing = self._extract_cost_sharing_fixed(text, text_lower)
         
         # Extract administrative details
-        administrative = self._extract_administrative_details(text)
+        administrative = self._extract_administrative_details(text, text_lower)
         
         # Use defaults if extraction fails but we have a valid file
         if not plan_id:
             # Generate ID from filename
             filename = Path(source_file).stem
-            plan_id = re.sub(r'[^A-Z0-9]', '', filename.upper())[:20]
+            plan_id = _NON_ID_CHARS.sub('', filename.upper())[:20]
         
         if not issuer:
             issuer = self._extract_issuer_from_filename(source_file)
@@ -161,60 +483,46 @@ class DocumentParser:
             marketing_name=marketing_name,
             metal_level=metal_level,
             monthly_premium=monthly_premium or 0.0,
-            deductible_individual=deductible or 0.0,
-            oop_max_individual=oop_max or 0.0,
+            deductible=deductible or 0.0,
+            oop_max=oop_max or 0.0,
             cost_sharing=cost_sharing,
             administrative=administrative
         )
     
-    def _extract_plan_id_fixed(self, text: str, source_file: str) -> str:
+    def _extract_plan_id_fixed(self, text: str, source_file: str,
+                               text_lower: Optional[str] = None) -> str:
         """Extract plan ID with Healthcare.gov specific patterns."""
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
         # Healthcare.gov format: digits + AZ + digits
-        patterns = [
-            r'Plan ID[:\s]+([0-9]+AZ[0-9]+)',
-            r'([0-9]{5,}AZ[0-9]{4,})',
-            r'Plan ID[:\s]+([A-Z0-9]+)',
-            r'ID#?\s*([0-9]{6,})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PLAN_ID_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
-                return match.group(1)
+                return text[match.start(1):match.end(1)]  # Original case
         
         # Fallback: extract from filename
         filename = Path(source_file).stem
-        id_match = re.search(r'([0-9]{6,})', filename)
+        id_match = _FILENAME_ID_PATTERN.search(filename)
         if id_match:
             return id_match.group(1)
         
         return filename[:20]  # Use truncated filename as last resort
     
-    def _extract_issuer_fixed(self, text: str, source_file: str) -> str:
+    def _extract_issuer_fixed(self, text: str, source_file: str,
+                              text_lower: Optional[str] = None) -> str:
         """Extract issuer with improved patterns."""
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
         # Clean text first
-        clean_text = text[:1000]  # Check first 1000 chars
+        clean_text = text_lower[:1000]  # Check first 1000 chars
         
         # Look for known issuers in text - more specific patterns
-        issuer_patterns = [
-            r'(Ambetter from Arizona Complete Health)',
-            r'(Ambetter)',
-            r'(Blue Cross Blue Shield of Arizona)',
-            r'(Blue Cross Blue Shield)',
-            r'(UnitedHealthcare)',
-            r'(UnitedHealth)',
-            r'(Banner Health)',
-            r'(Oscar Health)',
-            r'(Aetna)',
-            r'(Cigna)',
-            r'(Humana)',
-            r'(Imperial)',
-        ]
-        
-        for pattern in issuer_patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE)
+        for pattern in _ISSUER_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
-                issuer = match.group(1).strip()
+                issuer = text[match.start(1):match.end(1)].strip()
                 # Clean up any trailing garbage
                 issuer = issuer.split('\n')[0]
                 issuer = issuer.split('Quick')[0].strip()
@@ -228,16 +536,7 @@ class DocumentParser:
         """Extract issuer from filename."""
         filename_lower = Path(filename).stem.lower()
         
-        issuer_mappings = {
-            'amb': 'Ambetter',
-            'bcbs': 'Blue Cross Blue Shield',
-            'uhc': 'UnitedHealthcare',
-            'banner': 'Banner Health',
-            'imperial': 'Imperial Health',
-            'oscar': 'Oscar Health'
-        }
-        
-        for abbrev, full_name in issuer_mappings.items():
+        for abbrev, full_name in _FILENAME_ISSUERS:
             if abbrev in filename_lower:
                 return full_name
         
@@ -247,52 +546,42 @@ class DocumentParser:
         
         return 'Unknown Issuer'
     
-    def _extract_metal_level_fixed(self, text: str, source_file: str) -> MetalLevel:
+    def _extract_metal_level_fixed(self, text: str, source_file: str,
+                                   text_lower: Optional[str] = None) -> MetalLevel:
         """Extract metal level with improved matching."""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
         filename_lower = Path(source_file).stem.lower()
         
-        # Check both text and filename
-        combined = text_lower + ' ' + filename_lower
-        
-        # Order matters - check from highest to lowest tier
-        for metal in ['platinum', 'gold', 'silver', 'bronze', 'catastrophic']:
-            if metal in combined:
-                return self.metal_level_mapping[metal]
+        # Order matters - check from highest to lowest tier, in both text and
+        # filename (checked separately rather than copying them into one string)
+        for metal in _METAL_LEVEL_ORDER:
+            if metal in text_lower or metal in filename_lower:
+                return self.METAL_LEVEL_MAPPING[metal]
         
         return MetalLevel.SILVER  # Default
     
-    def _extract_marketing_name_fixed(self, text: str, source_file: str) -> str:
+    def _extract_marketing_name_fixed(self, text: str, source_file: str,
+                                      text_lower: Optional[str] = None) -> str:
         """Extract marketing name with better patterns."""
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
         # Try to find actual plan name in text
-        patterns = [
-            r'((?:Standard\s+)?(?:Gold|Silver|Bronze|Platinum)[^|]*?)(?:\s*\|)',
-            r'(Blue ACA[^|]+)',
-            r'Plan Name[:\s]+([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _MARKETING_NAME_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
-                name = match.group(1).strip()
+                name = text[match.start(1):match.end(1)].strip()
                 # Clean up the name
-                name = re.sub(r'\s+', ' ', name)
+                name = _WHITESPACE_RUN.sub(' ', name)
                 if len(name) > 5 and len(name) < 100:
                     return name
         
         # Fallback: build from filename
         filename = Path(source_file).stem
-        parts = filename.split('_')
         
         # Try to construct a reasonable name
-        if 'Gold' in filename:
-            metal = 'Gold'
-        elif 'Silver' in filename:
-            metal = 'Silver'
-        elif 'Bronze' in filename:
-            metal = 'Bronze'
-        else:
-            metal = ''
+        metal = next((metal for metal in _FILENAME_NAME_METALS if metal in filename), '')
         
         issuer = self._extract_issuer_from_filename(source_file)
         
@@ -301,35 +590,43 @@ class DocumentParser:
         
         return filename.replace('_', ' ')
     
-    def _extract_premium_fixed(self, text: str) -> Optional[float]:
+    def _extract_premium_fixed(self, text: str, text_lower: Optional[str] = None) -> Optional[float]:
         """Extract monthly premium with FIXED patterns matching Healthcare.gov format."""
-        patterns = [
-            r'Monthly premium\s*\$([0-9]+(?:\.[0-9]{2})?)',
-            r'premium\s*\$([0-9]+(?:\.[0-9]{2})?)\s*(?:/month|per month)?',
-            r'\$([0-9]+(?:\.[0-9]{2})?)\s*/month',
-            r'Was\s*\$([0-9]+(?:\.[0-9]{2})?)',  # Original premium before tax credit
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
+        # Every pattern needs a dollar amount; str.find is far cheaper than
+        # walking the regexes over text that has none
+        if '$' not in text_lower:
+            return None
+        
+        explicit_zero = None  # Whether the text states a $0 premium, checked if needed
+        
+        for pattern in _PREMIUM_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 value = float(match.group(1))
-                # Return the value if it's reasonable (not zero unless explicitly stated)
-                if value > 0 or 'premium $0' in text.lower():
+                if value > 0:
+                    return value
+                # Zero is only trusted when explicitly stated
+                if explicit_zero is None:
+                    explicit_zero = 'premium $0' in text_lower
+                if explicit_zero:
                     return value
         
         return None
     
-    def _extract_deductible_fixed(self, text: str) -> Optional[float]:
+    def _extract_deductible_fixed(self, text: str, text_lower: Optional[str] = None) -> Optional[float]:
         """Extract deductible with FIXED patterns."""
-        patterns = [
-            r'Deductible\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*Individual',
-            r'Deductible\s*\$([0-9,]+(?:\.[0-9]{2})?)',
-            r'Individual Deductible[:\s]*\$([0-9,]+(?:\.[0-9]{2})?)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
+        # Every pattern contains both of these literals
+        if '$' not in text_lower or 'deductible' not in text_lower:
+            return None
+        
+        for pattern in _DEDUCTIBLE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 # Remove commas and convert to float
                 value = float(match.group(1).replace(',', ''))
@@ -337,16 +634,17 @@ class DocumentParser:
         
         return None
     
-    def _extract_oop_max_fixed(self, text: str) -> Optional[float]:
+    def _extract_oop_max_fixed(self, text: str, text_lower: Optional[str] = None) -> Optional[float]:
         """Extract out-of-pocket maximum with FIXED patterns."""
-        patterns = [
-            r'Out-of-pocket maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*Individual',
-            r'Out-of-pocket maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)',
-            r'maximum\s*\$([0-9,]+(?:\.[0-9]{2})?)\s*Individual',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
+        # Every pattern contains both of these literals
+        if '$' not in text_lower or 'maximum' not in text_lower:
+            return None
+        
+        for pattern in _OOP_MAX_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 # Remove commas and convert to float
                 value = float(match.group(1).replace(',', ''))
@@ -354,60 +652,53 @@ class DocumentParser:
         
         return None
     
-    def _extract_cost_sharing_fixed(self, text: str) -> CostSharing:
+    def _extract_cost_sharing_fixed(self, text: str, text_lower: Optional[str] = None) -> CostSharing:
         """Extract cost sharing details with improved patterns."""
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
         cost_sharing = CostSharing()
         
+        # Every copay pattern needs a dollar amount
+        if '$' not in text_lower:
+            return cost_sharing
+        
         # Primary care copay
-        pcp_patterns = [
-            r'Primary care visit[:\s]*\$([0-9]+)',
-            r'PCP[:\s]*\$([0-9]+)',
-            r'Doctor visit[:\s]*\$([0-9]+)',
-        ]
-        
-        for pattern in pcp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PCP_COPAY_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 cost_sharing.primary_care_copay = float(match.group(1))
                 break
         
         # Specialist copay
-        spec_patterns = [
-            r'Specialist visit[:\s]*\$([0-9]+)',
-            r'Specialist[:\s]*\$([0-9]+)',
-        ]
-        
-        for pattern in spec_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SPECIALIST_COPAY_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 cost_sharing.specialist_copay = float(match.group(1))
                 break
         
         # Emergency room copay
-        er_patterns = [
-            r'Emergency room[:\s]*\$([0-9]+)',
-            r'ER visit[:\s]*\$([0-9]+)',
-            r'Emergency[:\s]*\$([0-9]+)',
-        ]
-        
-        for pattern in er_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ER_COPAY_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 cost_sharing.emergency_room_copay = float(match.group(1))
                 break
         
         return cost_sharing
     
-    def _extract_administrative_details(self, text: str) -> Administrative:
+    def _extract_administrative_details(self, text: str, text_lower: Optional[str] = None) -> Administrative:
         """Extract administrative details."""
+        if text_lower is None:
+            text_lower = _lowercase_text(text)
+        
         administrative = Administrative()
         
         # Check for referral requirements
-        if re.search(r'referral.*(required|needed)', text, re.IGNORECASE):
+        if _REFERRAL_PATTERN.search(text_lower):
             administrative.prior_auth_common = True
         
         # Check for prior authorization
-        if re.search(r'prior auth', text, re.IGNORECASE):
+        if _PRIOR_AUTH_PATTERN.search(text_lower):
             administrative.prior_auth_common = True
         
         # Default rating (would need external data source for actual ratings)
@@ -425,7 +716,7 @@ class DocumentParser:
             plan_id=data.get('plan_id', ''),
             issuer=data.get('issuer', ''),
             marketing_name=data.get('marketing_name', ''),
-            metal_level=self.metal_level_mapping.get(data.get('metal_level', '').lower(), MetalLevel.SILVER),
+            metal_level=self.METAL_LEVEL_MAPPING.get(data.get('metal_level', '').lower(), MetalLevel.SILVER),
             plan_type=PlanType[data.get('plan_type', 'PPO').upper()] if data.get('plan_type') else PlanType.PPO,
             monthly_premium=float(data.get('monthly_premium', 0)),
             deductible=float(deductible),
@@ -452,7 +743,7 @@ class DocumentParser:
                 plan_id=row.get('plan_id', ''),
                 issuer=row.get('issuer', ''),
                 marketing_name=row.get('marketing_name', ''),
-                metal_level=self.metal_level_mapping.get(row.get('metal_level', '').lower(), MetalLevel.SILVER),
+                metal_level=self.METAL_LEVEL_MAPPING.get(row.get('metal_level', '').lower(), MetalLevel.SILVER),
                 plan_type=PlanType[row.get('plan_type', 'PPO').upper()] if row.get('plan_type') else PlanType.PPO,
                 monthly_premium=float(row.get('monthly_premium', 0)),
                 deductible=float(deductible),
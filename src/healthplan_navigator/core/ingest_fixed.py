@@ -161,8 +161,8 @@ class DocumentParser:
             marketing_name=marketing_name,
             metal_level=metal_level,
             monthly_premium=monthly_premium or 0.0,
-            deductible_individual=deductible or 0.0,
-            oop_max_individual=oop_max or 0.0,
+            deductible=deductible or 0.0,
+            oop_max=oop_max or 0.0,
             cost_sharing=cost_sharing,
             administrative=administrative
         )
@@ -1,14 +1,24 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Union
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
 import re
+import sys
+import numpy as np
 
 
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+
+
+@lru_cache(maxsize=4096)
 def validate_zipcode(zipcode: str) -> str:
     """
     Validate and format zipcode for consistent use across the application.
     
+    Results are memoized per input, since batch runs see the same ZIP codes
+    repeatedly (invalid inputs raise and are not cached).
+    
     Args:
         zipcode: Input ZIP code in various formats
         
@@ -21,8 +31,11 @@ def validate_zipcode(zipcode: str) -> str:
     if not zipcode:
         raise ValueError("ZIP code is required")
     
-    # Remove any non-digit characters
-    digits_only = re.sub(r'[^0-9]', '', str(zipcode))
+    # Remove any non-digit characters (skipped for plain ASCII-digit input;
+    # isdigit alone would also accept non-ASCII digits the regex strips)
+    digits_only = str(zipcode)
+    if not (digits_only.isascii() and digits_only.isdigit()):
+        digits_only = _NON_DIGIT_RE.sub('', digits_only)
     
     # Check for 5-digit ZIP
     if len(digits_only) == 5:
@@ -35,7 +48,13 @@ def validate_zipcode(zipcode: str) -> str:
     raise ValueError(f"Invalid ZIP code format: {zipcode}. Must be at least 5 digits.")
 
 
-class MetalLevel(Enum):
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# String-valued enums mix in str, so members compare and hash equal to their
+# values (MetalLevel.SILVER == "Silver") and serialize as plain JSON strings
+class MetalLevel(str, Enum):
     BRONZE = "Bronze"
     SILVER = "Silver"
     GOLD = "Gold"
@@ -43,7 +62,7 @@ class MetalLevel(Enum):
     CATASTROPHIC = "Catastrophic"
 
 
-class PlanType(Enum):
+class PlanType(str, Enum):
     HMO = "HMO"
     PPO = "PPO"
     EPO = "EPO"
@@ -51,7 +70,7 @@ class PlanType(Enum):
     HDHP = "HDHP"
 
 
-class CoverageStatus(Enum):
+class CoverageStatus(str, Enum):
     COVERED = "COVERED"
     NOT_COVERED = "NOT"
     TIER1 = "TIER1"
@@ -60,17 +79,17 @@ class CoverageStatus(Enum):
     TIER4 = "TIER4"
 
 
-class Priority(Enum):
+class Priority(str, Enum):
     MUST_KEEP = "must-keep"
     NICE_TO_KEEP = "nice-to-keep"
 
 
-class NetworkStatus(Enum):
+class NetworkStatus(str, Enum):
     IN_NETWORK = "IN"
     OUT_OF_NETWORK = "OUT"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ManufacturerProgram:
     exists: bool
     program_type: Optional[str] = None  # "copay-card" or "rebate"
@@ -78,7 +97,7 @@ class ManufacturerProgram:
     expected_copay: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Provider:
     name: str
     specialty: str
@@ -87,7 +106,7 @@ class Provider:
     visit_frequency: int = 1  # per year
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Medication:
     name: str
     rxnorm_code: Optional[str] = None
@@ -97,21 +116,21 @@ class Medication:
     manufacturer_program: Optional[ManufacturerProgram] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SpecialTreatment:
     name: str
     frequency: int  # per year
     allowed_cost: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MedicalProfile:
     providers: List[Provider] = field(default_factory=list)
     medications: List[Medication] = field(default_factory=list)
     special_treatments: List[SpecialTreatment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PersonalInfo:
     full_name: str
     dob: str  # YYYY-MM-DD format
@@ -122,20 +141,16 @@ class PersonalInfo:
     
     def __post_init__(self):
         """Validate data after initialization."""
-        self.zipcode = self._validate_zipcode(self.zipcode)
+        self.zipcode = validate_zipcode(self.zipcode)
         
         if self.household_size < 1:
             raise ValueError("Household size must be at least 1")
         
         if self.annual_income < 0:
             raise ValueError("Annual income cannot be negative")
-    
-    def _validate_zipcode(self, zipcode: str) -> str:
-        """Validate and format zipcode using the global validation function."""
-        return validate_zipcode(zipcode)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Priorities:
     keep_providers: int = 3  # 1-5 scale
     minimize_total_cost: int = 3
@@ -144,14 +159,14 @@ class Priorities:
     simple_admin: int = 3
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Client:
     personal: PersonalInfo
     medical_profile: MedicalProfile
     priorities: Priorities
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CostSharing:
     primary_care_copay: float = 0
     specialist_copay: float = 0
@@ -159,14 +174,14 @@ class CostSharing:
     emergency_room_copay: float = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Administrative:
     prior_auth_common: bool = False
     uses_maximizer: bool = False
     plan_rating: float = 3.0  # 1-5 stars
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProviderNetwork:
     network_id: str
     name: str
@@ -175,7 +190,7 @@ class ProviderNetwork:
     urgent_care_centers: List[Dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DrugFormulary:
     formulary_id: str
     name: str
@@ -183,7 +198,7 @@ class DrugFormulary:
     covered_drugs: List[Dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Plan:
     plan_id: str
     issuer: str
@@ -192,9 +207,7 @@ class Plan:
     plan_type: PlanType = PlanType.PPO
     monthly_premium: float = 0.0
     deductible: float = 0.0  # Individual deductible
-    deductible_individual: Optional[float] = None  # Backwards compatibility
     oop_max: float = 0.0  # Individual out-of-pocket max
-    oop_max_individual: Optional[float] = None  # Backwards compatibility
     copay_primary: float = 0.0
     copay_specialist: float = 0.0
     copay_er: float = 0.0
@@ -209,15 +222,32 @@ class Plan:
     quality_rating: float = 0.0
     customer_rating: float = 0.0
     
-    def __post_init__(self):
-        # Handle backwards compatibility
-        if self.deductible_individual is not None and self.deductible == 0:
-            self.deductible = self.deductible_individual
-        if self.oop_max_individual is not None and self.oop_max == 0:
-            self.oop_max = self.oop_max_individual
-
-
-@dataclass
+    @classmethod
+    def from_legacy_dict(cls, data: Dict[str, Any]) -> 'Plan':
+        """
+        Build a Plan from field data that may use the legacy
+        deductible_individual / oop_max_individual names, which fill in
+        deductible / oop_max when those are missing or zero. Metal level
+        and plan type may be given as strings in any case.
+        """
+        data = dict(data)
+        if isinstance(data.get('metal_level'), str):
+            data['metal_level'] = MetalLevel(data['metal_level'].title())
+        if isinstance(data.get('plan_type'), str):
+            data['plan_type'] = PlanType(data['plan_type'].upper())
+        deductible_individual = data.pop('deductible_individual', None)
+        oop_max_individual = data.pop('oop_max_individual', None)
+        if deductible_individual is not None and not data.get('deductible'):
+            data['deductible'] = deductible_individual
+        if oop_max_individual is not None and not data.get('oop_max'):
+            data['oop_max'] = oop_max_individual
+        return cls(**data)
+
+
+# Column copies from AnalysisReport.to_score_arrays keep sub-scores as float16
+# (within 0.01 of these values on the 0-10 scale) and the weighted total as
+# float32, which still orders totals rounded to 2 decimals exactly
+@dataclass(**_SLOTS)
 class ScoringMetrics:
     provider_network_score: float = 0.0  # 0-10
     medication_coverage_score: float = 0.0  # 0-10
@@ -228,7 +258,7 @@ class ScoringMetrics:
     weighted_total_score: float = 0.0  # 0-10
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlanAnalysis:
     plan: Plan
     metrics: ScoringMetrics
@@ -238,9 +268,78 @@ class PlanAnalysis:
     notes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class PlanArrays:
+    """Numeric plan fields as one column per field, aligned by plan index."""
+    premiums: np.ndarray
+    deductibles: np.ndarray
+    oop_max: np.ndarray
+    pcp_copay: np.ndarray
+    specialist_copay: np.ndarray
+    er_copay: np.ndarray
+    plan_rating: np.ndarray
+    
+    @classmethod
+    def from_plans(cls, plans: List[Plan], dtype=np.float32) -> 'PlanArrays':
+        """Fill pre-allocated (n_plans,) columns in a single pass over plans."""
+        n = len(plans)
+        columns = np.empty((7, n), dtype=dtype)
+        for i, plan in enumerate(plans):
+            cost_sharing = plan.cost_sharing
+            columns[:, i] = (
+                plan.monthly_premium,
+                plan.deductible,
+                plan.oop_max,
+                cost_sharing.primary_care_copay,
+                cost_sharing.specialist_copay,
+                cost_sharing.emergency_room_copay,
+                plan.administrative.plan_rating,
+            )
+        return cls(*columns)
+
+
+@dataclass(**_SLOTS)
+class ScoreArrays:
+    """Scoring metrics as one column per metric, aligned by plan index."""
+    provider_network: np.ndarray
+    medication_coverage: np.ndarray
+    total_cost: np.ndarray
+    financial_protection: np.ndarray
+    administrative_simplicity: np.ndarray
+    plan_quality: np.ndarray
+    weighted_total: np.ndarray
+    
+    @classmethod
+    def from_analyses(cls, analyses: List[PlanAnalysis]) -> 'ScoreArrays':
+        """Fill float16 sub-score columns and a float32 total in one pass."""
+        n = len(analyses)
+        sub_scores = np.empty((6, n), dtype=np.float16)
+        weighted_total = np.empty(n, dtype=np.float32)
+        for i, analysis in enumerate(analyses):
+            metrics = analysis.metrics
+            sub_scores[:, i] = (
+                metrics.provider_network_score,
+                metrics.medication_coverage_score,
+                metrics.total_cost_score,
+                metrics.financial_protection_score,
+                metrics.administrative_simplicity_score,
+                metrics.plan_quality_score,
+            )
+            weighted_total[i] = metrics.weighted_total_score
+        return cls(*sub_scores, weighted_total)
+
+
+@dataclass(**_SLOTS)
 class AnalysisReport:
     client: Client
     plan_analyses: List[PlanAnalysis]
     generated_at: datetime = field(default_factory=datetime.now)
-    top_recommendations: List[PlanAnalysis] = field(default_factory=list)
\ No newline at end of file
+    top_recommendations: List[PlanAnalysis] = field(default_factory=list)
+    
+    def to_arrays(self, dtype=np.float32) -> PlanArrays:
+        """Numeric fields of the analyzed plans as columns, in plan_analyses order."""
+        return PlanArrays.from_plans([analysis.plan for analysis in self.plan_analyses], dtype)
+    
+    def to_score_arrays(self) -> ScoreArrays:
+        """Scoring metrics of the analyzed plans as columns, in plan_analyses order."""
+        return ScoreArrays.from_analyses(self.plan_analyses)
\ No newline at end of file
@@ -1,7 +1,28 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+import numpy as np
 from .models import Client, Plan, PlanAnalysis, ScoringMetrics, Priority, CoverageStatus, NetworkStatus
 
 
+# Enum members and lookup tables used per plan x provider/medication, resolved
+# once at import instead of re-fetching enum attributes inside scoring loops
+_MUST_KEEP = Priority.MUST_KEEP
+_IN_NETWORK = NetworkStatus.IN_NETWORK
+_OUT_OF_NETWORK = NetworkStatus.OUT_OF_NETWORK
+_NOT_COVERED = CoverageStatus.NOT_COVERED
+_COVERED_STATUSES = frozenset((CoverageStatus.COVERED, CoverageStatus.TIER1, CoverageStatus.TIER2,
+                               CoverageStatus.TIER3, CoverageStatus.TIER4))
+_PRIMARY_CARE_SPECIALTIES = frozenset(('primary care', 'family medicine', 'internal medicine'))
+
+# Estimated cost per dose by formulary tier; anything else pays full cost
+_TIER_DOSE_COSTS = {
+    CoverageStatus.TIER1: 10,
+    CoverageStatus.TIER2: 50,
+    CoverageStatus.TIER3: 100,
+    CoverageStatus.TIER4: 300,
+}
+_UNCOVERED_DOSE_COST = 500
+
+
 class HealthPlanScorer:
     """
     Implements the 6-metric scoring algorithm for healthcare plans.
@@ -23,34 +44,88 @@ class HealthPlanScorer:
     
     def score_plan(self, client: Client, plan: Plan, all_plans: List[Plan]) -> PlanAnalysis:
         """Score a single plan against client requirements."""
+        analysis = self.score_plan_deferred(client, plan)
+        metrics = analysis.metrics
+        
+        # Calculate cost score (requires all plans for normalization)
+        metrics.total_cost_score = self._score_total_cost(analysis.estimated_annual_cost, all_plans, client)
+        
+        # Calculate weighted total
+        metrics.weighted_total_score = self._calculate_weighted_score(metrics)
+        
+        return analysis
+    
+    def score_plans(self, client: Client, plans: List[Plan]) -> List[PlanAnalysis]:
+        """
+        Score a set of plans together; equivalent to score_plan for each.
+        
+        score_plan re-estimates every plan's annual cost to normalize one
+        plan's cost score, which is quadratic over the set. Here each cost is
+        estimated once and normalized across the set in one pass.
+        """
+        analyses = [self.score_plan_deferred(client, plan) for plan in plans]
+        self.apply_cost_scores(analyses)
+        return analyses
+    
+    def score_plan_deferred(self, client: Client, plan: Plan) -> PlanAnalysis:
+        """
+        Score every metric that depends only on this plan.
+        
+        The cost score and weighted total need the full plan set and stay at
+        0 until apply_cost_scores runs, so plans can be scored as they arrive.
+        """
         metrics = ScoringMetrics()
         
+        # Look up the client's providers and medications in this plan once;
+        # the metrics, cost estimate and details below all reuse the result
+        provider_details = self._get_provider_coverage_details(client, plan)
+        coverage = self._get_formulary_coverage(client, plan)
+        
         # Calculate each metric
-        metrics.provider_network_score = self._score_provider_network(client, plan)
-        metrics.medication_coverage_score = self._score_medication_coverage(client, plan)
+        metrics.provider_network_score = self._score_provider_network(client, plan, provider_details)
+        metrics.medication_coverage_score = self._score_medication_coverage(client, plan, coverage)
         metrics.financial_protection_score = self._score_financial_protection(plan)
         metrics.administrative_simplicity_score = self._score_administrative_simplicity(plan)
         metrics.plan_quality_score = self._score_plan_quality(plan)
         
-        # Calculate cost score (requires all plans for normalization)
-        estimated_cost = self._calculate_annual_cost(client, plan)
-        metrics.total_cost_score = self._score_total_cost(estimated_cost, all_plans, client)
-        
-        # Calculate weighted total
-        metrics.weighted_total_score = self._calculate_weighted_score(metrics)
-        
         # Create analysis with details
         analysis = PlanAnalysis(
             plan=plan,
             metrics=metrics,
-            estimated_annual_cost=estimated_cost,
-            provider_coverage_details=self._get_provider_coverage_details(client, plan),
-            medication_coverage_details=self._get_medication_coverage_details(client, plan)
+            estimated_annual_cost=self._calculate_annual_cost(client, plan, coverage),
+            provider_coverage_details=provider_details,
+            medication_coverage_details={name: status.value for name, status in coverage.items()}
         )
         
         return analysis
     
-    def _score_provider_network(self, client: Client, plan: Plan) -> float:
+    def apply_cost_scores(self, analyses: List[PlanAnalysis]):
+        """
+        Fill in cost and weighted scores for analyses from score_plan_deferred.
+        
+        Uses the same lowest = 10 / highest = 0 normalization as
+        _score_total_cost, taken over the analyses' estimated costs.
+        """
+        if not analyses:
+            return
+        
+        costs = np.fromiter((analysis.estimated_annual_cost for analysis in analyses),
+                            dtype=np.float64, count=len(analyses))
+        min_cost = costs.min()
+        max_cost = costs.max()
+        
+        if max_cost == min_cost:
+            cost_scores = np.full(len(analyses), 10.0)  # All plans cost the same
+        else:
+            cost_scores = np.clip(10 * (max_cost - costs) / (max_cost - min_cost), 0, 10)
+        
+        for analysis, cost_score in zip(analyses, cost_scores.tolist()):
+            metrics = analysis.metrics
+            metrics.total_cost_score = cost_score
+            metrics.weighted_total_score = self._calculate_weighted_score(metrics)
+    
+    def _score_provider_network(self, client: Client, plan: Plan,
+                                provider_details: Optional[Dict[str, bool]] = None) -> float:
         """
         Metric 1: Provider Network Adequacy (30% weight)
         - 10 points: All must-keep providers in-network
@@ -59,15 +134,14 @@ class HealthPlanScorer:
         - 0 points: <50% must-keep providers in-network
         - Penalty: -2 points if any specialist requires referral
         """
-        must_keep_providers = [p for p in client.medical_profile.providers if p.priority == Priority.MUST_KEEP]
+        must_keep_providers = [p for p in client.medical_profile.providers if p.priority == _MUST_KEEP]
         
         if not must_keep_providers:
             score = 10.0  # No must-keep providers = perfect score
         else:
-            in_network_count = sum(
-                1 for provider in must_keep_providers
-                if plan.network.get(provider.name, NetworkStatus.OUT_OF_NETWORK) == NetworkStatus.IN_NETWORK
-            )
+            if provider_details is None:
+                provider_details = self._get_provider_coverage_details(client, plan)
+            in_network_count = sum(1 for provider in must_keep_providers if provider_details[provider.name])
             coverage_ratio = in_network_count / len(must_keep_providers)
             
             if coverage_ratio == 1.0:
@@ -85,7 +159,8 @@ class HealthPlanScorer:
         
         return score
     
-    def _score_medication_coverage(self, client: Client, plan: Plan) -> float:
+    def _score_medication_coverage(self, client: Client, plan: Plan,
+                                   coverage: Optional[Dict[str, CoverageStatus]] = None) -> float:
         """
         Metric 2: Medication Coverage & Access (25% weight)
         - Base score: Weighted average of drug coverage scores
@@ -97,14 +172,17 @@ class HealthPlanScorer:
         if not client.medical_profile.medications:
             return 10.0  # No medications = perfect score
         
+        if coverage is None:
+            coverage = self._get_formulary_coverage(client, plan)
+        
         total_score = 0
         for medication in client.medical_profile.medications:
             med_score = 0
-            coverage = plan.formulary.get(medication.name, CoverageStatus.NOT_COVERED)
+            status = coverage[medication.name]
             
-            if coverage in [CoverageStatus.COVERED, CoverageStatus.TIER1, CoverageStatus.TIER2, CoverageStatus.TIER3, CoverageStatus.TIER4]:
+            if status in _COVERED_STATUSES:
                 med_score = 10
-            elif coverage == CoverageStatus.NOT_COVERED:
+            elif status == _NOT_COVERED:
                 if medication.manufacturer_program and medication.manufacturer_program.exists:
                     med_score = 6
                 else:
@@ -123,14 +201,15 @@ class HealthPlanScorer:
         
         return max(0, min(10, base_score))
     
-    def _calculate_annual_cost(self, client: Client, plan: Plan) -> float:
+    def _calculate_annual_cost(self, client: Client, plan: Plan,
+                               coverage: Optional[Dict[str, CoverageStatus]] = None) -> float:
         """Calculate estimated annual cost for this client and plan."""
         annual_premium = plan.monthly_premium * 12
         
         # Estimate visit costs
         visit_costs = 0
         for provider in client.medical_profile.providers:
-            if provider.specialty.lower() in ['primary care', 'family medicine', 'internal medicine']:
+            if provider.specialty.lower() in _PRIMARY_CARE_SPECIALTIES:
                 visit_costs += provider.visit_frequency * plan.cost_sharing.primary_care_copay
             else:
                 visit_costs += provider.visit_frequency * plan.cost_sharing.specialist_copay
@@ -142,17 +221,11 @@ class HealthPlanScorer:
                 medication_costs += medication.annual_doses * (medication.manufacturer_program.expected_copay or 0)
             else:
                 # Estimate based on formulary tier
-                coverage = plan.formulary.get(medication.name, CoverageStatus.NOT_COVERED)
-                if coverage == CoverageStatus.TIER1:
-                    medication_costs += medication.annual_doses * 10
-                elif coverage == CoverageStatus.TIER2:
-                    medication_costs += medication.annual_doses * 50
-                elif coverage == CoverageStatus.TIER3:
-                    medication_costs += medication.annual_doses * 100
-                elif coverage == CoverageStatus.TIER4:
-                    medication_costs += medication.annual_doses * 300
+                if coverage is not None:
+                    status = coverage[medication.name]
                 else:
-                    medication_costs += medication.annual_doses * 500  # Full cost if not covered
+                    status = plan.formulary.get(medication.name, _NOT_COVERED)
+                medication_costs += medication.annual_doses * _TIER_DOSE_COSTS.get(status, _UNCOVERED_DOSE_COST)
         
         # Add deductible and estimate unexpected care
         estimated_unexpected = 1000  # Conservative estimate
@@ -188,7 +261,7 @@ class HealthPlanScorer:
         - 4 points: Deductible ≤ $2,000 AND OOPM ≤ $7,000
         - 0 points: Higher than above thresholds
         """
-        # Use the unified deductible and oop_max fields (backwards compatibility handled in Plan.__post_init__)
+        # Unified deductible and oop_max fields (legacy field names are mapped by Plan.from_legacy_dict)
         deductible = plan.deductible
         oopm = plan.oop_max
         
@@ -249,14 +322,18 @@ class HealthPlanScorer:
         """Get detailed provider coverage information."""
         details = {}
         for provider in client.medical_profile.providers:
-            in_network = plan.network.get(provider.name, NetworkStatus.OUT_OF_NETWORK) == NetworkStatus.IN_NETWORK
+            in_network = plan.network.get(provider.name, _OUT_OF_NETWORK) == _IN_NETWORK
             details[provider.name] = in_network
         return details
     
     def _get_medication_coverage_details(self, client: Client, plan: Plan) -> Dict[str, str]:
         """Get detailed medication coverage information."""
-        details = {}
-        for medication in client.medical_profile.medications:
-            coverage = plan.formulary.get(medication.name, CoverageStatus.NOT_COVERED)
-            details[medication.name] = coverage.value
-        return details
\ No newline at end of file
+        return {name: status.value for name, status in self._get_formulary_coverage(client, plan).items()}
+    
+    def _get_formulary_coverage(self, client: Client, plan: Plan) -> Dict[str, CoverageStatus]:
+        """Look up each of the client's medications in the plan formulary once."""
+        formulary = plan.formulary
+        return {
+            medication.name: formulary.get(medication.name, _NOT_COVERED)
+            for medication in client.medical_profile.medications
+        }
\ No newline at end of file
@@ -4,10 +4,16 @@ Healthcare.gov API Integration Module
 Fetches and transforms plan data from the Healthcare.gov marketplace.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
+import threading
 import time
 import os
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Dict, Optional, Any, Tuple, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 import logging
@@ -17,9 +23,101 @@ from urllib3.util.retry import Retry
 
 from ..core.models import Plan, MetalLevel, PlanType, DrugFormulary, ProviderNetwork
 
+# Optional faster JSON codec for API responses and the response cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for streaming large responses and cache files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional zstd compression for the on-disk response cache
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
 
+def _with_case_variants(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Add Title and UPPER spellings so canonical API values skip .lower()."""
+    variants = dict(mapping)
+    for key, value in mapping.items():
+        variants[key.title()] = value
+        variants[key.upper()] = value
+    return variants
+
+
+# Shared read-only default for nested API objects, so a missing key does not
+# allocate a fresh {} per plan. Never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+# API enum spellings, keyed by lowercase plus the casings the feeds use
+_METAL_LEVEL_MAP = _with_case_variants({
+    'bronze': MetalLevel.BRONZE,
+    'silver': MetalLevel.SILVER,
+    'gold': MetalLevel.GOLD,
+    'platinum': MetalLevel.PLATINUM,
+    'catastrophic': MetalLevel.CATASTROPHIC
+})
+
+_PLAN_TYPE_MAP = _with_case_variants({
+    'hmo': PlanType.HMO,
+    'ppo': PlanType.PPO,
+    'epo': PlanType.EPO,
+    'pos': PlanType.POS,
+    'hdhp': PlanType.HDHP
+})
+
+
+def _parse_json(content: bytes) -> Any:
+    """Decode a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a value for the CMS datastore SQL dialect, doubling embedded quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+# Optional ZIP3 -> CMS service-area ID mapping shipped as package data. When
+# a prefix is listed, CMS queries use an exact (indexed) IN match instead of
+# a substring LIKE scan.
+_SERVICE_AREA_MAP_FILE = Path(__file__).resolve().parent.parent / 'data' / 'zip3_to_service_areas.json'
+
+
+@functools.lru_cache(maxsize=None)
+def _service_area_map() -> Dict[str, frozenset]:
+    """Load the ZIP3 -> service-area mapping once; empty if it is not installed."""
+    try:
+        data = _parse_json(_SERVICE_AREA_MAP_FILE.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.debug(f"No ZIP3 service-area map loaded: {e}")
+        return {}
+    return {str(zip3): frozenset(map(str, area_ids)) for zip3, area_ids in data.items() if area_ids}
+
+
+class _TeeReader:
+    """Readable stream that copies every chunk read from source into sink."""
+    
+    def __init__(self, source, sink):
+        self._source = source
+        self._sink = sink
+    
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._source.read(size)
+        if chunk:
+            self._sink.write(chunk)
+        return chunk
+
+
 class HealthcareGovAPI:
     """
     Interface for Healthcare.gov marketplace API.
@@ -41,16 +139,48 @@ class HealthcareGovAPI:
     CMS_QHP_URL = "https://data.healthcare.gov/api/1/datastore/sql"
     CMS_DATASET_ID = "b8in-sz6k"  # 2025 QHP Individual Medical Landscape
     
-    def __init__(self, api_key: Optional[str] = None, cache_dir: str = "./cache"):
+    # Default response cache freshness, and how many decoded responses stay
+    # in memory
+    CACHE_TTL_SECONDS = 86400  # 24 hours
+    MEMORY_CACHE_SIZE = 128
+    
+    # Cache files at least this large are streamed plan by plan (with ijson)
+    # rather than decoded whole, bounding peak memory on big marketplace pulls
+    STREAM_CACHE_MIN_BYTES = 1 << 20
+    
+    # Token-bucket rate limit: sustained requests per second, and how many
+    # may go out back to back after an idle spell
+    RATE_LIMIT_PER_SECOND = 2.0
+    RATE_LIMIT_BURST = 10
+    
+    # Pooled connections per host, so concurrent fetch_plans_async calls
+    # can all reuse the session
+    HTTP_POOL_MAXSIZE = 32
+    
+    # CMS queries arriving within this window with the same filters are sent
+    # as one SQL query over all their ZIP prefixes; rows kept per prefix, and
+    # the HTTP timeout for that query
+    CMS_BATCH_WINDOW_SECONDS = 0.02
+    CMS_QUERY_LIMIT = 100
+    CMS_QUERY_TIMEOUT_SECONDS = 30
+    
+    # zstd level for compressed cache files (when zstandard is installed)
+    CACHE_COMPRESSION_LEVEL = 3
+    
+    def __init__(self, api_key: Optional[str] = None, cache_dir: str = "./cache",
+                 ttl_seconds: float = CACHE_TTL_SECONDS):
         """
         Initialize Healthcare.gov API client.
         
         Args:
             api_key: API key for authentication (when available)
             cache_dir: Directory for caching API responses
+            ttl_seconds: How long cached responses stay fresh (default 24 hours)
         """
         self.api_key = api_key or os.getenv('HEALTHCARE_GOV_API_KEY')
         self.cache_dir = Path(cache_dir)
+        self._cache_dir_str = str(self.cache_dir)  # cache paths are built as plain strings
+        self.ttl_seconds = ttl_seconds
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Set up session with retry strategy
@@ -60,12 +190,27 @@ class HealthcareGovAPI:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.HTTP_POOL_MAXSIZE)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
-        self.rate_limit_delay = 0.5  # Delay between requests in seconds
-        self.last_request_time = 0
+        self._bucket_tokens = float(self.RATE_LIMIT_BURST)
+        self._bucket_last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()  # fetch_plans_async calls overlap
+        
+        # Decoded cache entries by key, with their monotonic expiry, so
+        # repeated lookups in one process skip the stat/read/decode entirely
+        # until the entry's remaining freshness runs out. Setting
+        # HEALTHCARE_GOV_MEMORY_CACHE=0 turns this layer off (disk cache only).
+        self.memory_cache_enabled = os.getenv('HEALTHCARE_GOV_MEMORY_CACHE', '1').lower() not in ('0', 'false', 'no')
+        self._memory_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        
+        # Pending CMS lookups by (metal levels, plan types): ZIP prefix and
+        # the future its caller is waiting on
+        self._cms_pending: Dict[Tuple, List[Tuple[str, Future]]] = {}
+        self._cms_pending_lock = threading.Lock()
+        self._cms_callers = 0  # CMS lookups in progress, guarded by the same lock
     
     def fetch_plans(self, 
                    zipcode: str,
@@ -88,18 +233,18 @@ class HealthcareGovAPI:
         """
         # Check cache first
         cache_key = self._generate_cache_key(zipcode, county_fips, metal_levels, plan_types, year)
-        cached_data = self._load_from_cache(cache_key)
+        cached_plans = self._load_cached_plans(cache_key)
         
-        if cached_data:
+        if cached_plans is not None:
             logger.info(f"Using cached data for {zipcode}")
-            return self._transform_to_plans(cached_data)
+            return cached_plans
         
         # Try CMS public data API first (no auth required)
         try:
             plans_data = self._fetch_cms_public_data(zipcode, county_fips, metal_levels, plan_types, year)
             if plans_data:
                 self._save_to_cache(cache_key, plans_data)
-                return self._transform_to_plans(plans_data)
+                return list(self._transform_to_plans(plans_data.get('plans', ())))
         except Exception as e:
             logger.warning(f"CMS public data fetch failed: {e}")
         
@@ -122,26 +267,78 @@ class HealthcareGovAPI:
                 if plan_types:
                     params['plan_types'] = ','.join(plan_types)
                 
-                # Make API request
-                response = self.session.get(
+                headers = {'Authorization': f'Bearer {self.api_key}'}
+                
+                # Revalidate an expired cache entry instead of re-downloading it
+                validators = self._load_cache_validators(cache_key)
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+                
+                # Make API request; the body is only read once we know
+                # whether to stream it
+                with self.session.get(
                     f"{self.BASE_URL}{self.PLANS_ENDPOINT}",
                     params=params,
-                    headers={'Authorization': f'Bearer {self.api_key}'},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self._save_to_cache(cache_key, data)
-                    return self._transform_to_plans(data)
-                else:
-                    logger.error(f"API request failed: {response.status_code}")
+                    headers=headers,
+                    timeout=30,
+                    stream=True
+                ) as response:
+                    if response.status_code == 304 and validators:
+                        self._refresh_cache(cache_key)
+                        cached_plans = self._load_cached_plans(cache_key)
+                        if cached_plans is not None:
+                            logger.info(f"Cached data for {zipcode} not modified")
+                            return cached_plans
+                    
+                    if response.status_code == 200:
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        content_length = response.headers.get('Content-Length')
+                        if ijson is not None and (content_length is None or
+                                                  int(content_length) >= self.STREAM_CACHE_MIN_BYTES):
+                            # Content-Length is only the payload size for an
+                            # unencoded body
+                            payload_size = None
+                            if content_length is not None and not response.headers.get('Content-Encoding'):
+                                payload_size = int(content_length)
+                            return self._stream_plans_response(cache_key, response, etag, last_modified,
+                                                               payload_size)
+                        
+                        data = _parse_json(response.content)
+                        self._save_to_cache(cache_key, data, etag=etag, last_modified=last_modified)
+                        return list(self._transform_to_plans(data.get('plans', ())))
+                    else:
+                        logger.error(f"API request failed: {response.status_code}")
             except Exception as e:
                 logger.error(f"Healthcare.gov API error: {e}")
         
         logger.warning("Healthcare.gov API not available. Use local files or provide API key.")
         return []
     
+    async def fetch_plans_async(self,
+                                zipcode: str,
+                                county_fips: Optional[str] = None,
+                                metal_levels: Optional[List[str]] = None,
+                                plan_types: Optional[List[str]] = None,
+                                year: Optional[int] = None) -> List[Plan]:
+        """
+        Awaitable fetch_plans for issuing several searches concurrently.
+        
+        The blocking request runs in the event loop's default executor, so
+        calls gathered together overlap their network waits while sharing
+        this client's session, cache and rate limit.
+        
+        Returns:
+            List of Plan objects available in the specified area
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.fetch_plans, zipcode, county_fips, metal_levels, plan_types, year)
+        )
+    
     def fetch_provider_network(self, plan_id: str) -> Optional[ProviderNetwork]:
         """
         Fetch provider network details for a specific plan.
@@ -185,102 +382,349 @@ class HealthcareGovAPI:
             covered_drugs=[]
         )
     
-    def _transform_to_plans(self, api_data: Dict[str, Any]) -> List[Plan]:
+    def fetch_provider_networks(self, plan_ids: List[str]) -> Dict[str, Optional[ProviderNetwork]]:
         """
-        Transform Healthcare.gov API response to Plan objects.
+        Fetch provider networks for many plans.
         
-        Args:
-            api_data: Raw API response data
+        Returns:
+            Dictionary mapping each plan ID to its network (or None)
+        """
+        return self._fetch_for_plans(self.fetch_provider_network, plan_ids)
+    
+    def fetch_drug_formularies(self, plan_ids: List[str]) -> Dict[str, Optional[DrugFormulary]]:
+        """
+        Fetch drug formularies for many plans.
+        
+        Returns:
+            Dictionary mapping each plan ID to its formulary (or None)
+        """
+        return self._fetch_for_plans(self.fetch_drug_formulary, plan_ids)
+    
+    async def fetch_provider_networks_async(self, plan_ids: List[str]) -> List[Optional[ProviderNetwork]]:
+        """
+        Fetch provider networks for many plans.
+        
+        Returns:
+            One result per plan ID, in the same order as plan_ids
+        """
+        networks = self._fetch_for_plans(self.fetch_provider_network, plan_ids)
+        return [networks[plan_id] for plan_id in plan_ids]
+    
+    async def fetch_drug_formularies_async(self, plan_ids: List[str]) -> List[Optional[DrugFormulary]]:
+        """
+        Fetch drug formularies for many plans.
         
         Returns:
-            List of Plan objects
+            One result per plan ID, in the same order as plan_ids
+        """
+        formularies = self._fetch_for_plans(self.fetch_drug_formulary, plan_ids)
+        return [formularies[plan_id] for plan_id in plan_ids]
+    
+    def _fetch_for_plans(self, fetch, plan_ids: List[str]) -> Dict[str, Any]:
+        """Run a per-plan fetch once for each distinct ID, in order."""
+        # The per-plan fetches are placeholders that do no I/O, so they run
+        # inline; batch them concurrently once they make real requests
+        return {plan_id: fetch(plan_id) for plan_id in dict.fromkeys(plan_ids)}
+    
+    def _transform_to_plans(self, plans_data: Iterable[Dict[str, Any]]) -> Iterator[Plan]:
+        """
+        Transform Healthcare.gov API plan records to Plan objects.
+        
+        Records are consumed lazily, so an ijson stream is turned into Plans
+        as it is parsed; callers that need a list wrap this in list().
+        
+        Args:
+            plans_data: Raw plan dicts (the 'plans' array of a response)
+        
+        Yields:
+            Plan objects
         """
-        plans = []
+        map_metal_level = self._map_metal_level
+        map_plan_type = self._map_plan_type
         
-        for plan_data in api_data.get('plans', []):
+        for plan_data in plans_data:
             try:
+                get = plan_data.get
+                copays = get('copays', _EMPTY)
+                quality = get('quality_rating', _EMPTY)
+                
                 # Map API fields to Plan model
                 plan = Plan(
-                    plan_id=plan_data.get('id', ''),
-                    marketing_name=plan_data.get('name', ''),
-                    issuer=plan_data.get('issuer', {}).get('name', ''),
-                    metal_level=self._map_metal_level(plan_data.get('metal_level', '')),
-                    plan_type=self._map_plan_type(plan_data.get('type', '')),
-                    monthly_premium=float(plan_data.get('premium', 0)),
-                    deductible=float(plan_data.get('deductible', {}).get('individual', 0)),
-                    oop_max=float(plan_data.get('moop', {}).get('individual', 0)),
-                    copay_primary=float(plan_data.get('copays', {}).get('primary', 0)),
-                    copay_specialist=float(plan_data.get('copays', {}).get('specialist', 0)),
-                    copay_er=float(plan_data.get('copays', {}).get('emergency', 0)),
-                    coinsurance=float(plan_data.get('coinsurance', 0)) / 100,
+                    plan_id=get('id', ''),
+                    marketing_name=get('name', ''),
+                    issuer=get('issuer', _EMPTY).get('name', ''),
+                    metal_level=map_metal_level(get('metal_level', '')),
+                    plan_type=map_plan_type(get('type', '')),
+                    monthly_premium=float(get('premium', 0)),
+                    deductible=float(get('deductible', _EMPTY).get('individual', 0)),
+                    oop_max=float(get('moop', _EMPTY).get('individual', 0)),
+                    copay_primary=float(copays.get('primary', 0)),
+                    copay_specialist=float(copays.get('specialist', 0)),
+                    copay_er=float(copays.get('emergency', 0)),
+                    coinsurance=float(get('coinsurance', 0)) / 100,
                     provider_network=None,  # Will be fetched separately
                     drug_formulary=None,    # Will be fetched separately
-                    quality_rating=float(plan_data.get('quality_rating', {}).get('global', 0)),
-                    customer_rating=float(plan_data.get('quality_rating', {}).get('customer', 0))
+                    quality_rating=float(quality.get('global', 0)),
+                    customer_rating=float(quality.get('customer', 0))
                 )
-                plans.append(plan)
             except Exception as e:
                 logger.error(f"Error transforming plan data: {e}")
                 continue
-        
-        return plans
+            yield plan
     
-    def _map_metal_level(self, api_value: str) -> MetalLevel:
+    @staticmethod
+    def _map_metal_level(api_value: str) -> MetalLevel:
         """Map API metal level to enum."""
-        mapping = {
-            'bronze': MetalLevel.BRONZE,
-            'silver': MetalLevel.SILVER,
-            'gold': MetalLevel.GOLD,
-            'platinum': MetalLevel.PLATINUM,
-            'catastrophic': MetalLevel.CATASTROPHIC
-        }
-        return mapping.get(api_value.lower(), MetalLevel.BRONZE)
-    
-    def _map_plan_type(self, api_value: str) -> PlanType:
+        return _METAL_LEVEL_MAP.get(api_value) or _METAL_LEVEL_MAP.get(api_value.lower(), MetalLevel.BRONZE)
+    
+    @staticmethod
+    def _map_plan_type(api_value: str) -> PlanType:
         """Map API plan type to enum."""
-        mapping = {
-            'hmo': PlanType.HMO,
-            'ppo': PlanType.PPO,
-            'epo': PlanType.EPO,
-            'pos': PlanType.POS,
-            'hdhp': PlanType.HDHP
-        }
-        return mapping.get(api_value.lower(), PlanType.PPO)
+        return _PLAN_TYPE_MAP.get(api_value) or _PLAN_TYPE_MAP.get(api_value.lower(), PlanType.PPO)
     
     def _apply_rate_limit(self):
-        """Apply rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """
+        Take a token from the rate-limit bucket, sleeping until it is due.
         
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+        The token is reserved under the lock (the balance may go negative)
+        and the wait happens outside it, so concurrent callers sleep in
+        parallel rather than queueing behind one another's sleeps.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                self.RATE_LIMIT_BURST,
+                self._bucket_tokens + (now - self._bucket_last_refill) * self.RATE_LIMIT_PER_SECOND
+            )
+            self._bucket_last_refill = now
+            self._bucket_tokens -= 1
+            wait = -self._bucket_tokens / self.RATE_LIMIT_PER_SECOND
         
-        self.last_request_time = time.time()
+        if wait > 0:
+            time.sleep(wait)
     
-    def _generate_cache_key(self, *args) -> str:
-        """Generate cache key from request parameters."""
-        key_parts = [str(arg) for arg in args if arg is not None]
-        return "_".join(key_parts).replace(" ", "_")
+    def _generate_cache_key(self, zipcode: str, county_fips: Optional[str] = None,
+                            metal_levels: Optional[List[str]] = None,
+                            plan_types: Optional[List[str]] = None,
+                            year: Optional[int] = None) -> str:
+        """
+        Generate cache key from request parameters.
+        
+        Filter lists are sorted, so the same search in any order shares an
+        entry, and the parameters are hashed to a fixed-length name behind a
+        readable ZIP prefix.
+        """
+        params = [zipcode, county_fips, sorted(metal_levels or ()), sorted(plan_types or ()), year]
+        digest = hashlib.blake2b(
+            json.dumps(params, separators=(',', ':')).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return f"plans_{zipcode}_{digest}".replace(" ", "_")
     
-    def _load_from_cache(self, cache_key: str) -> Optional[Dict]:
-        """Load data from cache if available and fresh."""
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _load_cached_plans(self, cache_key: str) -> Optional[List[Plan]]:
+        """
+        Transform a fresh cached response into Plans, or None on a miss.
         
-        if cache_file.exists():
-            # Check if cache is fresh (less than 24 hours old)
-            age = time.time() - cache_file.stat().st_mtime
-            if age < 86400:  # 24 hours
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
+        Large cache files are streamed with ijson when it is installed, so
+        only one raw plan dict is alive at a time; they are not kept in the
+        in-memory cache. Smaller files go through _load_from_cache.
+        """
+        cached = None
+        if ijson is not None:
+            with self._memory_cache_lock:
+                in_memory = cache_key in self._memory_cache
+            if not in_memory:
+                cached = self._stat_cache_file(cache_key)
+                if cached is not None:
+                    path, st = cached
+                    if (self._cached_payload_size(path, st.st_size) >= self.STREAM_CACHE_MIN_BYTES
+                            and time.time() - st.st_mtime < self.ttl_seconds):
+                        with open(path, 'rb') as f:
+                            if path.endswith('.zst'):
+                                f = zstd.ZstdDecompressor().stream_reader(f)
+                            return list(self._transform_to_plans(ijson.items(f, 'plans.item')))
+        
+        cached_data = self._load_from_cache(cache_key, cached)
+        if cached_data:
+            return list(self._transform_to_plans(cached_data.get('plans', ())))
+        return None
+    
+    def _load_from_cache(self, cache_key: str,
+                         cached: Optional[Tuple[str, os.stat_result]] = None) -> Optional[Dict]:
+        """
+        Load data from cache if available and fresh.
+        
+        cached is a (path, stat) pair from _stat_cache_file, when the caller
+        has already looked the file up.
+        """
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None:
+                expires_at, data = entry
+                if time.monotonic() < expires_at:
+                    self._memory_cache.move_to_end(cache_key)
+                    return data
+                del self._memory_cache[cache_key]
+        
+        if cached is None:
+            cached = self._stat_cache_file(cache_key)
+        
+        if cached is not None:
+            path, st = cached
+            # Check if cache is fresh (younger than ttl_seconds)
+            age = time.time() - st.st_mtime
+            if age < self.ttl_seconds:
+                with open(path, 'rb') as f:
+                    content = f.read()
+                if path.endswith('.zst'):
+                    # decompressobj also handles streamed frames that do
+                    # not record their size
+                    content = zstd.ZstdDecompressor().decompressobj().decompress(content)
+                data = _parse_json(content)
+                self._remember(cache_key, data, self.ttl_seconds - age)
+                return data
         
         return None
     
-    def _save_to_cache(self, cache_key: str, data: Dict):
-        """Save data to cache."""
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _remember(self, cache_key: str, data: Any, ttl: float):
+        """Keep a decoded response in memory, evicting the least recently used."""
+        if not self.memory_cache_enabled:
+            return
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = (time.monotonic() + ttl, data)
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _cache_path(self, cache_key: str, suffix: str) -> str:
+        """Path of a cache file for a key."""
+        return os.path.join(self._cache_dir_str, cache_key + suffix)
+    
+    def _stat_cache_file(self, cache_key: str) -> Optional[Tuple[str, os.stat_result]]:
+        """
+        Find the cache file for a key, preferring a zstd-compressed one.
+        
+        Returns its path and stat, or None if there is none; each candidate
+        costs a single stat call.
+        """
+        suffixes = ('.json.zst', '.json') if zstd is not None else ('.json',)
+        for suffix in suffixes:
+            path = self._cache_path(cache_key, suffix)
+            try:
+                return path, os.stat(path)
+            except FileNotFoundError:
+                continue
+        return None
+    
+    def _cached_payload_size(self, path: str, file_size: int) -> int:
+        """
+        Uncompressed size of a cache file, read from the zstd frame header.
+        
+        Frames written by _stream_plans_response may not record a size;
+        those only come from large responses, so they count as streamable.
+        """
+        if not path.endswith('.zst'):
+            return file_size
+        with open(path, 'rb') as f:
+            size = zstd.frame_content_size(f.read(18))
+        return size if size >= 0 else max(file_size, self.STREAM_CACHE_MIN_BYTES)
+    
+    def _save_to_cache(self, cache_key: str, data: Dict,
+                       etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Save data to cache (compact JSON, zstd-compressed when available).
+        
+        A response's ETag / Last-Modified go in a {key}.meta.json sidecar so
+        the entry can be revalidated with a conditional request once stale.
+        """
+        if orjson is not None:
+            content = orjson.dumps(data)
+        else:
+            content = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        
+        if zstd is not None:
+            compressor = zstd.ZstdCompressor(level=self.CACHE_COMPRESSION_LEVEL)
+            with open(self._cache_path(cache_key, '.json.zst'), 'wb') as f:
+                f.write(compressor.compress(content))
+        else:
+            with open(self._cache_path(cache_key, '.json'), 'wb') as f:
+                f.write(content)
+        
+        self._save_cache_validators(cache_key, etag, last_modified)
+        
+        # Responses big enough to be streamed back are not held in memory
+        if ijson is None or len(content) < self.STREAM_CACHE_MIN_BYTES:
+            self._remember(cache_key, data, self.ttl_seconds)
+    
+    def _stream_plans_response(self, cache_key: str, response: requests.Response,
+                               etag: Optional[str] = None,
+                               last_modified: Optional[str] = None,
+                               content_length: Optional[int] = None) -> List[Plan]:
+        """
+        Build Plans straight off a large response body while caching it.
+        
+        The body is parsed with ijson as it arrives and copied verbatim into
+        the cache file, so only one raw plan dict is alive at a time and
+        transforming overlaps the download. The file is written under a
+        temporary name and only replaces the cache entry once complete.
+        
+        content_length, when the body is not content-encoded, is recorded
+        in the zstd frame header as the payload size.
+        """
+        response.raw.decode_content = True
+        path = self._cache_path(cache_key, '.json.zst' if zstd is not None else '.json')
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                sink = f
+                if zstd is not None:
+                    compressor = zstd.ZstdCompressor(level=self.CACHE_COMPRESSION_LEVEL)
+                    sink = compressor.stream_writer(f, size=content_length if content_length is not None else -1)
+                tee = _TeeReader(response.raw, sink)
+                plans = list(self._transform_to_plans(ijson.items(tee, 'plans.item')))
+                # Copy any fields after the plans array as well
+                while tee.read(65536):
+                    pass
+                if sink is not f:
+                    sink.flush(zstd.FLUSH_FRAME)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
         
-        with open(cache_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._save_cache_validators(cache_key, etag, last_modified)
+        return plans
+    
+    def _save_cache_validators(self, cache_key: str, etag: Optional[str],
+                               last_modified: Optional[str]):
+        """Write (or clear) the ETag / Last-Modified sidecar for a cache entry."""
+        meta_path = self._cache_path(cache_key, '.meta.json')
+        if etag or last_modified:
+            with open(meta_path, 'w') as f:
+                json.dump({'etag': etag, 'last_modified': last_modified}, f)
+        else:
+            try:
+                os.remove(meta_path)
+            except FileNotFoundError:
+                pass
+    
+    def _load_cache_validators(self, cache_key: str) -> Dict[str, Optional[str]]:
+        """ETag / Last-Modified saved with a cache entry, or {} if there are none."""
+        if self._stat_cache_file(cache_key) is None:
+            return {}
+        try:
+            with open(self._cache_path(cache_key, '.meta.json'), 'rb') as f:
+                return _parse_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def _refresh_cache(self, cache_key: str):
+        """Restart an entry's TTL after the server confirmed it is unchanged."""
+        cached = self._stat_cache_file(cache_key)
+        if cached is not None:
+            os.utime(cached[0])
     
     def get_available_counties(self, zipcode: str) -> List[Dict[str, str]]:
         """
@@ -312,9 +756,6 @@ class HealthcareGovAPI:
             Dictionary with plan data
         """
         try:
-            # Build SQL query for CMS data
-            year_val = year or datetime.now().year
-            
             # Validate and sanitize zipcode
             if not zipcode or len(zipcode) < 3:
                 logger.warning("Invalid zipcode for CMS query")
@@ -326,7 +767,107 @@ class HealthcareGovAPI:
                 logger.warning("No valid digits in zipcode")
                 return {}
             
-            query = f"""
+            # Sanitize metal levels and plan types - only allow known values
+            valid_levels = ['Bronze', 'Silver', 'Gold', 'Platinum', 'Catastrophic']
+            safe_levels = tuple(level for level in metal_levels or () if level in valid_levels)
+            valid_types = ['HMO', 'PPO', 'EPO', 'POS', 'HDHP']
+            safe_types = tuple(ptype for ptype in plan_types or () if ptype in valid_types)
+            
+            future = Future()
+            batch_key = (safe_levels, safe_types)
+            with self._cms_pending_lock:
+                self._cms_callers += 1
+                # A lone lookup is sent straight away rather than waiting out
+                # a batch window nobody else will join
+                solo = self._cms_callers == 1
+                if not solo:
+                    # Queue the lookup; the first caller for these filters
+                    # schedules the flush that answers everyone queued
+                    # within the window
+                    batch = self._cms_pending.get(batch_key)
+                    if batch is None:
+                        batch = self._cms_pending[batch_key] = []
+                        timer = threading.Timer(self.CMS_BATCH_WINDOW_SECONDS,
+                                                self._flush_cms_batch, args=(batch_key,))
+                        timer.daemon = True
+                        timer.start()
+                    batch.append((zip_prefix, future))
+            try:
+                if solo:
+                    self._answer_cms_batch(batch_key, [(zip_prefix, future)])
+                return future.result(timeout=self.CMS_QUERY_TIMEOUT_SECONDS + self.CMS_BATCH_WINDOW_SECONDS)
+            finally:
+                with self._cms_pending_lock:
+                    self._cms_callers -= 1
+            
+        except Exception as e:
+            logger.debug(f"CMS data fetch error: {e!r}")
+        
+        return {}
+    
+    def _flush_cms_batch(self, batch_key: Tuple):
+        """Answer every ZIP prefix queued for these filters (runs on the batch timer)."""
+        with self._cms_pending_lock:
+            batch = self._cms_pending.pop(batch_key, [])
+        if batch:
+            self._answer_cms_batch(batch_key, batch)
+    
+    def _answer_cms_batch(self, batch_key: Tuple, batch: List[Tuple[str, Future]]):
+        """
+        Send one CMS query for a batch's ZIP prefixes and split the rows back out.
+        
+        Any failure, from the query or from splitting its rows, is set on
+        every future still pending so no caller is left waiting.
+        
+        The batched query shares one LIMIT across its prefixes. When that
+        limit is reached, a prefix with more rows can crowd the others out,
+        so any prefix left short of a full page is queried again on its own
+        and gets the same rows a solo lookup would.
+        """
+        try:
+            prefixes = list(dict.fromkeys(prefix for prefix, _ in batch))
+            rows = self._query_cms_plans(prefixes, *batch_key)
+            
+            area_map = _service_area_map()
+            results = {}
+            for prefix in prefixes:
+                if rows is None:
+                    results[prefix] = {}
+                elif len(prefixes) == 1:
+                    results[prefix] = {'plans': rows}
+                else:
+                    area_ids = area_map.get(prefix)
+                    if area_ids:
+                        matches = [row for row in rows if row.get('service_area_id') in area_ids]
+                    else:
+                        matches = [row for row in rows if prefix in str(row.get('service_area_id', ''))]
+                    if (len(matches) < self.CMS_QUERY_LIMIT and
+                            len(rows) >= self.CMS_QUERY_LIMIT * len(prefixes)):
+                        solo_rows = self._query_cms_plans([prefix], *batch_key)
+                        results[prefix] = {'plans': solo_rows} if solo_rows is not None else {}
+                    else:
+                        results[prefix] = {'plans': matches[:self.CMS_QUERY_LIMIT]}
+            for prefix, future in batch:
+                future.set_result(results[prefix])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+    
+    def _query_cms_plans(self, prefixes: List[str], safe_levels: Tuple[str, ...],
+                         safe_types: Tuple[str, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Run a CMS SQL query over one or more ZIP prefixes; None if it fails."""
+        # Mapped prefixes become one exact IN list; any without a mapping
+        # still fall back to a substring match
+        area_map = _service_area_map()
+        area_ids = sorted(set().union(*(area_map.get(prefix, ()) for prefix in prefixes)))
+        area_clauses = []
+        if area_ids:
+            area_clauses.append(f'"ServiceAreaId" IN ({", ".join(map(_sql_literal, area_ids))})')
+        area_clauses.extend(f'"ServiceAreaId" LIKE \'%{prefix}%\''
+                            for prefix in prefixes if not area_map.get(prefix))
+        area_filter = " OR ".join(area_clauses)
+        query = f"""
             [SELECT 
                 "PlanId" as id,
                 "PlanMarketingName" as name,
@@ -341,45 +882,32 @@ class HealthcareGovAPI:
                 "Specialist - Standard" as copay_specialist,
                 "Emergency Room - Standard" as copay_er,
                 "Generic Drugs - Standard" as drug_tier1,
-                "Quality Rating - Global Rating" as quality_rating
+                "Quality Rating - Global Rating" as quality_rating,
+                "ServiceAreaId" as service_area_id
             FROM "{self.CMS_DATASET_ID}"
-            WHERE "ServiceAreaId" LIKE '%{zip_prefix}%'
+            WHERE ({area_filter})
             """
-            
-            if metal_levels:
-                # Sanitize metal levels - only allow known values
-                valid_levels = ['Bronze', 'Silver', 'Gold', 'Platinum', 'Catastrophic']
-                safe_levels = [level for level in metal_levels if level in valid_levels]
-                if safe_levels:
-                    levels_str = "','".join(safe_levels)
-                    query += f' AND "MetalLevel" IN (\'{levels_str}\')'
-            
-            if plan_types:
-                # Sanitize plan types - only allow known values
-                valid_types = ['HMO', 'PPO', 'EPO', 'POS', 'HDHP']
-                safe_types = [ptype for ptype in plan_types if ptype in valid_types]
-                if safe_types:
-                    types_str = "','".join(safe_types)
-                    query += f' AND "PlanType" IN (\'{types_str}\')'
-            
-            query += " LIMIT 100]"
-            
-            # Make request to CMS API
-            response = self.session.get(
-                self.CMS_QHP_URL,
-                params={'query': query},
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Transform to expected format
-                return {'plans': data}
-            
-        except Exception as e:
-            logger.debug(f"CMS data fetch error: {e}")
         
-        return {}
+        if safe_levels:
+            query += f' AND "MetalLevel" IN ({", ".join(map(_sql_literal, safe_levels))})'
+        
+        if safe_types:
+            query += f' AND "PlanType" IN ({", ".join(map(_sql_literal, safe_types))})'
+        
+        # Stable order so pages line up; room for a full page per prefix,
+        # and rows are capped per prefix again when the batch is split
+        query += f' ORDER BY "PlanId" LIMIT {self.CMS_QUERY_LIMIT * len(prefixes)}]'
+        
+        # Make request to CMS API
+        response = self.session.get(
+            self.CMS_QHP_URL,
+            params={'query': query},
+            timeout=self.CMS_QUERY_TIMEOUT_SECONDS
+        )
+        
+        if response.status_code == 200:
+            return _parse_json(response.content)
+        return None
     
     def validate_api_access(self) -> bool:
         """
@@ -14,9 +14,34 @@ import requests
 
 from ..core.models import Medication, DrugFormulary
 
+# Optional faster JSON codec for the on-disk caches
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Any:
+    """Read a JSON cache file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _write_json(path: Path, data: Any):
+    """Write a JSON cache file compactly, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+
 class MedicationIntegration:
     """
     Manages medication formulary and pricing data integration.
@@ -392,25 +417,22 @@ class MedicationIntegration:
         cache_file = self.cache_dir / "drug_cache.json"
         
         if cache_file.exists():
-            with open(cache_file, 'r') as f:
-                self.drug_cache = json.load(f)
+            self.drug_cache = _read_json(cache_file)
         
         price_cache_file = self.cache_dir / "price_cache.json"
         
         if price_cache_file.exists():
-            with open(price_cache_file, 'r') as f:
-                cached = json.load(f)
-                # Convert timestamp strings back to datetime
-                for key, value in cached.items():
-                    value['timestamp'] = datetime.fromisoformat(value['timestamp'])
-                self.price_cache = cached
+            cached = _read_json(price_cache_file)
+            # Convert timestamp strings back to datetime
+            for key, value in cached.items():
+                value['timestamp'] = datetime.fromisoformat(value['timestamp'])
+            self.price_cache = cached
     
     def _save_drug_cache(self):
         """Save drug cache to disk."""
         cache_file = self.cache_dir / "drug_cache.json"
         
-        with open(cache_file, 'w') as f:
-            json.dump(self.drug_cache, f, indent=2)
+        _write_json(cache_file, self.drug_cache)
         
         # Save price cache with serialized timestamps
         price_cache_file = self.cache_dir / "price_cache.json"
@@ -422,5 +444,4 @@ class MedicationIntegration:
                 'timestamp': value['timestamp'].isoformat()
             }
         
-        with open(price_cache_file, 'w') as f:
-            json.dump(cache_copy, f, indent=2)
\ No newline at end of file
+        _write_json(price_cache_file, cache_copy)
\ No newline at end of file
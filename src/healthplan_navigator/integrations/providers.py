@@ -7,16 +7,69 @@ Handles provider network data from various sources.
 import json
 import logging
 import os
-from typing import List, Dict, Optional, Set, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Any, Tuple
 from pathlib import Path
+import numpy as np
 import requests
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
 from ..core.models import Provider, ProviderNetwork, Priority
 
+# Optional faster JSON codec for the on-disk caches
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental JSON parser for large NPPES result pages
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional HTTP response cache for repeated NPPES searches
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 logger = logging.getLogger(__name__)
 
 
+def _similarity(scorer, a: str, b: str) -> int:
+    """
+    Whole-number rapidfuzz score, 0 when either string is empty.
+    
+    Matches fuzzywuzzy, which scored empty strings 0; rapidfuzz rates two
+    empty strings a perfect 100.
+    """
+    if not a or not b:
+        return 0
+    return round(scorer(a, b))
+
+
+def _parse_json(content: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON cache file."""
+    with open(path, 'rb') as f:
+        return _parse_json(f.read())
+
+
+def _json_line(data: Any) -> bytes:
+    """Encode one NDJSON record, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
 class ProviderNetworkIntegration:
     """
     Manages provider network data integration from multiple sources.
@@ -32,6 +85,20 @@ class ProviderNetworkIntegration:
     NPPES_API_URL = "https://npiregistry.cms.hhs.gov/api/"
     NPPES_SEARCH_ENDPOINT = "?version=2.1"
     
+    # How long cached NPPES responses are reused (when requests-cache is
+    # installed); NPPES_CACHE_TTL overrides it in seconds
+    HTTP_CACHE_TTL_SECONDS = 86400  # 24 hours
+    
+    # Parallel NPPES requests in search_providers_bulk, and the response
+    # size from which results are streamed with ijson instead of decoded whole
+    MAX_CONCURRENT_SEARCHES = 8
+    NPPES_STREAM_MIN_BYTES = 256 * 1024
+    
+    # The provider cache is an append-only NDJSON log, one provider per
+    # line (later lines win); it is rewritten without superseded lines once
+    # they outnumber the live entries by this many
+    PROVIDER_LOG_COMPACT_SLACK = 1000
+    
     def __init__(self, cache_dir: str = "./cache/providers", nppes_api_key: Optional[str] = None):
         """
         Initialize provider network integration.
@@ -43,10 +110,32 @@ class ProviderNetworkIntegration:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.provider_cache = {}
+        self._provider_cache_lock = threading.Lock()  # bulk searches run in threads
+        self._provider_log_lines = 0
         self.nppes_api_key = nppes_api_key or os.getenv('NPPES_API_KEY')
-        self.session = requests.Session()
+        self.session = self._create_session()
+        # Large NPPES pages are streamed through ijson, except from a cached
+        # session, which has to read the whole body to store it
+        self._stream_nppes = ijson is not None and requests_cache is None
         self._load_provider_cache()
     
+    def _create_session(self) -> requests.Session:
+        """HTTP session for NPPES, backed by an on-disk response cache when available."""
+        if requests_cache is None:
+            return requests.Session()
+        ttl = float(os.getenv('NPPES_CACHE_TTL', self.HTTP_CACHE_TTL_SECONDS))
+        return requests_cache.CachedSession(
+            str(self.cache_dir / 'http_cache'),
+            backend='sqlite',
+            expire_after=ttl,
+            allowable_methods=('GET',)
+        )
+    
+    def clear_http_cache(self):
+        """Drop cached NPPES responses so the next searches hit the registry."""
+        if requests_cache is not None:
+            self.session.cache.clear()
+    
     def check_provider_in_network(self, 
                                   provider: Provider, 
                                   network: ProviderNetwork,
@@ -62,21 +151,68 @@ class ProviderNetworkIntegration:
         Returns:
             True if provider is found in network
         """
-        if not network or not network.providers:
-            return False
-        
-        # Try exact match first
-        for network_provider in network.providers:
-            if self._exact_match(provider, network_provider):
-                return True
-        
-        # Try fuzzy match if enabled
-        if fuzzy_match:
-            for network_provider in network.providers:
-                if self._fuzzy_match(provider, network_provider):
-                    return True
+        return self._providers_in_network([provider], network, fuzzy_match)[0]
+    
+    def _providers_in_network(self,
+                              providers: List[Provider],
+                              network: ProviderNetwork,
+                              fuzzy_match: bool = True) -> List[bool]:
+        """
+        Check several providers against a network at once.
         
-        return False
+        Exact matches (the _exact_match rules) are looked up in sets built
+        once from the network; the providers left over are fuzzy matched
+        against every network provider in one rapidfuzz cdist call per
+        field instead of a Python loop over pairs.
+        """
+        if not network or not network.providers:
+            return [False] * len(providers)
+        
+        # Each name and specialty is lowercased once here and shared by the
+        # exact index and the fuzzy pass
+        network_names = [p.get('name', '').lower() for p in network.providers]
+        network_specialties = [p.get('specialty', '').lower() for p in network.providers]
+        client_names = [provider.name.lower() for provider in providers]
+        client_specialties = [provider.specialty.lower() for provider in providers]
+        
+        # Network entries with an NPI match on NPI alone; the rest on
+        # name and specialty
+        npi_index = set()
+        name_index = set()
+        for network_provider, name, specialty in zip(network.providers, network_names, network_specialties):
+            npi = network_provider.get('npi')
+            if npi:
+                npi_index.add(npi)
+            else:
+                name_index.add((name, specialty))
+        
+        found = [
+            provider.npi in npi_index or (name, specialty) in name_index
+            for provider, name, specialty in zip(providers, client_names, client_specialties)
+        ]
+        
+        unmatched = [i for i, is_found in enumerate(found) if not is_found]
+        if fuzzy_match and unmatched:
+            name_scores = process.cdist(
+                [client_names[i] for i in unmatched], network_names,
+                scorer=fuzz.ratio, dtype=np.float64
+            )
+            specialty_scores = process.cdist(
+                [client_specialties[i] for i in unmatched], network_specialties,
+                scorer=fuzz.partial_ratio, dtype=np.float64
+            )
+            # An empty name or specialty scores 0 (see _similarity)
+            for scores, client_values, network_values in (
+                    (name_scores, client_names, network_names),
+                    (specialty_scores, client_specialties, network_specialties)):
+                scores[[not client_values[i] for i in unmatched], :] = 0
+                scores[:, [not value for value in network_values]] = 0
+            # Same thresholds as _fuzzy_match, on whole-number scores
+            matches = ((np.round(name_scores) > 85) & (np.round(specialty_scores) > 70)).any(axis=1)
+            for i, is_match in zip(unmatched, matches):
+                found[i] = bool(is_match)
+        
+        return found
     
     def _exact_match(self, provider1: Provider, provider2: Dict) -> bool:
         """Check for exact provider match."""
@@ -92,17 +228,14 @@ class ProviderNetworkIntegration:
     
     def _fuzzy_match(self, provider1: Provider, provider2: Dict) -> bool:
         """Check for fuzzy provider match."""
-        # Use fuzzy string matching for names
-        name_ratio = fuzz.ratio(
-            provider1.name.lower(),
-            provider2.get('name', '').lower()
-        )
+        # Use fuzzy string matching for names (scores rounded to whole
+        # percentages, as fuzzywuzzy reported them)
+        name_ratio = _similarity(fuzz.ratio, provider1.name.lower(),
+                                 provider2.get('name', '').lower())
         
         # Check if specialty matches (exact or partial)
-        specialty_ratio = fuzz.partial_ratio(
-            provider1.specialty.lower(),
-            provider2.get('specialty', '').lower()
-        )
+        specialty_ratio = _similarity(fuzz.partial_ratio, provider1.specialty.lower(),
+                                      provider2.get('specialty', '').lower())
         
         # Consider a match if name is >85% similar and specialty is >70% similar
         return name_ratio > 85 and specialty_ratio > 70
@@ -121,9 +254,7 @@ class ProviderNetworkIntegration:
         cache_file = self.cache_dir / f"network_{network_id}.json"
         
         if cache_file.exists():
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                return self._deserialize_network(data)
+            return self._deserialize_network(_read_json(cache_file))
         
         # TODO: Implement API calls to fetch network data
         logger.warning(f"Network {network_id} not found in cache")
@@ -154,18 +285,53 @@ class ProviderNetworkIntegration:
         Returns:
             List of provider dictionaries
         """
-        results = []
-        
-        # Try NPPES API first
         try:
             nppes_results = self._search_nppes(specialty, location)
-            if nppes_results:
-                results.extend(nppes_results)
         except Exception as e:
             logger.debug(f"NPPES search error: {e}")
+            nppes_results = []
+        
+        return self._with_cached_providers(specialty, nppes_results)
+    
+    def search_providers_bulk(self,
+                              queries: Iterable[Tuple[Optional[str], Optional[str]]]
+                              ) -> Dict[Tuple[Optional[str], Optional[str]], List[Dict]]:
+        """
+        Run search_providers for many (specialty, location) pairs at once.
+        
+        NPPES requests go out in parallel, MAX_CONCURRENT_SEARCHES at a time.
+        
+        Returns:
+            Dictionary mapping each distinct query to its provider list
+        """
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+        
+        def search(query):
+            try:
+                return self._search_nppes(*query)
+            except Exception as e:
+                logger.debug(f"NPPES search error: {e}")
+                return []
+        
+        workers = min(self.MAX_CONCURRENT_SEARCHES, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            nppes_results = list(executor.map(search, queries))
+        
+        return {
+            query: self._with_cached_providers(query[0], results)
+            for query, results in zip(queries, nppes_results)
+        }
+    
+    def _with_cached_providers(self, specialty: Optional[str], nppes_results: List[Dict]) -> List[Dict]:
+        """Append cached providers matching the specialty to NPPES results."""
+        results = list(nppes_results)
         
         # Search in cache as fallback
-        for provider_id, provider_data in self.provider_cache.items():
+        with self._provider_cache_lock:
+            cached_providers = list(self.provider_cache.values())
+        for provider_data in cached_providers:
             if specialty and specialty.lower() in provider_data.get('specialty', '').lower():
                 results.append(provider_data)
         
@@ -197,51 +363,115 @@ class ProviderNetworkIntegration:
                 params['city'] = location
         
         try:
-            response = self.session.get(
+            # Closed on every path so a streamed response always returns its
+            # connection to the pool
+            with self.session.get(
                 self.NPPES_API_URL + self.NPPES_SEARCH_ENDPOINT,
                 params=params,
-                timeout=15
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                providers = []
-                
-                for result in data.get('results', []):
-                    provider = {
-                        'npi': result.get('number'),
-                        'name': f"{result.get('basic', {}).get('first_name', '')} {result.get('basic', {}).get('last_name', '')}".strip(),
-                        'specialty': result.get('taxonomies', [{}])[0].get('desc', '') if result.get('taxonomies') else '',
-                        'address': result.get('addresses', [{}])[0] if result.get('addresses') else {},
-                        'phone': result.get('addresses', [{}])[0].get('telephone_number', '') if result.get('addresses') else ''
-                    }
-                    providers.append(provider)
-                    
-                    # Cache the provider
-                    self.provider_cache[provider['npi']] = provider
+                timeout=15,
+                stream=self._stream_nppes
+            ) as response:
+                if response.status_code == 200:
+                    providers = []
                 
-                self._save_provider_cache()
-                return providers
+                    for result in self._nppes_results(response):
+                        provider = {
+                            'npi': result.get('number'),
+                            'name': f"{result.get('basic', {}).get('first_name', '')} {result.get('basic', {}).get('last_name', '')}".strip(),
+                            'specialty': result.get('taxonomies', [{}])[0].get('desc', '') if result.get('taxonomies') else '',
+                            'address': result.get('addresses', [{}])[0] if result.get('addresses') else {},
+                            'phone': result.get('addresses', [{}])[0].get('telephone_number', '') if result.get('addresses') else ''
+                        }
+                        providers.append(provider)
                 
+                    # Cache the providers
+                    self._cache_providers(providers)
+                    return providers
+            
         except Exception as e:
             logger.error(f"NPPES API error: {e}")
         
         return []
     
-    def _load_provider_cache(self):
-        """Load provider cache from disk."""
-        cache_file = self.cache_dir / "provider_cache.json"
+    def _nppes_results(self, response: requests.Response) -> Iterable[Dict]:
+        """
+        Iterate the result records of an NPPES response.
         
-        if cache_file.exists():
-            with open(cache_file, 'r') as f:
-                self.provider_cache = json.load(f)
+        Large pages are streamed with ijson (when installed, and responses
+        are not being cached) so the full document is never decoded at once;
+        others are decoded whole.
+        """
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if self._stream_nppes and content_length >= self.NPPES_STREAM_MIN_BYTES:
+            response.raw.decode_content = True
+            return ijson.items(response.raw, 'results.item', use_float=True)
+        return response.json().get('results', [])
     
-    def _save_provider_cache(self):
-        """Save provider cache to disk."""
-        cache_file = self.cache_dir / "provider_cache.json"
-        
-        with open(cache_file, 'w') as f:
-            json.dump(self.provider_cache, f, indent=2)
+    def _load_provider_cache(self):
+        """Load provider cache from disk (migrating the old JSON file if present)."""
+        log_file = self.cache_dir / "provider_cache.ndjson"
+        legacy_file = self.cache_dir / "provider_cache.json"
+        
+        migrate = legacy_file.exists()
+        if migrate:
+            for provider in _read_json(legacy_file).values():
+                self.provider_cache[provider.get('npi')] = provider
+        
+        # A crash mid-append can leave a torn last line; such lines are
+        # skipped and the log rewritten without them
+        corrupt_lines = 0
+        if log_file.exists():
+            with open(log_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            provider = _parse_json(line)
+                            npi = provider.get('npi')
+                        except (ValueError, AttributeError):
+                            corrupt_lines += 1
+                            continue
+                        self.provider_cache[npi] = provider
+                        self._provider_log_lines += 1
+        if corrupt_lines:
+            logger.warning(f"Skipped {corrupt_lines} unreadable line(s) in {log_file}")
+        
+        if (migrate or corrupt_lines or
+                self._provider_log_lines - len(self.provider_cache) > self.PROVIDER_LOG_COMPACT_SLACK):
+            self._compact_provider_cache()
+            if migrate:
+                legacy_file.unlink()
+    
+    def _cache_providers(self, providers: List[Dict]):
+        """Add providers to the cache, appending new or changed ones to the log."""
+        with self._provider_cache_lock:
+            changed = []
+            for provider in providers:
+                if self.provider_cache.get(provider['npi']) != provider:
+                    self.provider_cache[provider['npi']] = provider
+                    changed.append(provider)
+            if not changed:
+                return
+            
+            with open(self.cache_dir / "provider_cache.ndjson", 'ab') as f:
+                f.write(b''.join(_json_line(provider) for provider in changed))
+            self._provider_log_lines += len(changed)
+            
+            if self._provider_log_lines - len(self.provider_cache) > self.PROVIDER_LOG_COMPACT_SLACK:
+                self._write_provider_log()
+    
+    def _compact_provider_cache(self):
+        """Rewrite the provider log with one line per cached provider."""
+        with self._provider_cache_lock:
+            self._write_provider_log()
+    
+    def _write_provider_log(self):
+        """Replace the provider log with the current cache (lock held by caller)."""
+        log_file = self.cache_dir / "provider_cache.ndjson"
+        tmp_file = log_file.with_suffix('.ndjson.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(b''.join(_json_line(provider) for provider in self.provider_cache.values()))
+        os.replace(tmp_file, log_file)
+        self._provider_log_lines = len(self.provider_cache)
     
     def calculate_network_coverage(self, 
                                    client_providers: List[Provider],
@@ -256,18 +486,18 @@ class ProviderNetworkIntegration:
         Returns:
             Dictionary with coverage statistics
         """
-        must_keep_providers = [p for p in client_providers if p.priority == Priority.MUST_KEEP]
-        nice_to_keep_providers = [p for p in client_providers if p.priority == Priority.NICE_TO_KEEP]
-        
-        must_keep_covered = sum(
-            1 for p in must_keep_providers 
-            if self.check_provider_in_network(p, network)
-        )
-        
-        nice_to_keep_covered = sum(
-            1 for p in nice_to_keep_providers 
-            if self.check_provider_in_network(p, network)
-        )
+        must_keep_providers = []
+        nice_to_keep_providers = []
+        for provider in client_providers:
+            if provider.priority == Priority.MUST_KEEP:
+                must_keep_providers.append(provider)
+            elif provider.priority == Priority.NICE_TO_KEEP:
+                nice_to_keep_providers.append(provider)
+        
+        # One network index and one cdist pass for both groups
+        covered = self._providers_in_network(must_keep_providers + nice_to_keep_providers, network)
+        must_keep_covered = sum(covered[:len(must_keep_providers)])
+        nice_to_keep_covered = sum(covered[len(must_keep_providers):])
         
         total_covered = must_keep_covered + nice_to_keep_covered
         total_providers = len(client_providers)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the HealthPlanAnalyzer orchestrator.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.analyzer import HealthPlanAnalyzer
+from src.healthplan_navigator.core.models import Plan, MetalLevel, PlanType
+
+
+class TestStreamingAnalysis(unittest.TestCase):
+    """Test how errors surface from analyze(stream=True)."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = HealthPlanAnalyzer(output_dir=self.temp_dir, use_plan_cache=False)
+        self.client = mock.Mock()
+
+    def test_empty_stream_reports_no_plans(self):
+        """A stream that yields nothing is reported as no plans."""
+        with mock.patch.object(self.analyzer, '_fetch_healthcare_gov_plans', return_value=[]):
+            with self.assertRaisesRegex(ValueError, "No plans available for analysis"):
+                self.analyzer.analyze(self.client, healthcare_gov_fetch=True, stream=True)
+
+    def test_loader_error_propagates_unchanged(self):
+        """Loader errors keep their own message instead of becoming "no plans"."""
+        with mock.patch.object(self.analyzer, '_fetch_healthcare_gov_plans',
+                               side_effect=ValueError("Unsupported file format: .txt")):
+            with self.assertRaisesRegex(ValueError, "Unsupported file format"):
+                self.analyzer.analyze(self.client, healthcare_gov_fetch=True, stream=True)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestHealthcareGovFetch(unittest.TestCase):
+    """Test the sharded Healthcare.gov plan fetch."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = HealthPlanAnalyzer(output_dir=self.temp_dir, use_plan_cache=False)
+        self.analyzer._current_client = mock.Mock()
+        self.analyzer._current_client.personal.zipcode = "85001"
+        self.calls = []
+
+    def _fetch_plans(self, zipcode, county_fips=None, metal_levels=None, plan_types=None, year=None):
+        self.calls.append((zipcode, metal_levels, plan_types))
+        return [
+            Plan(plan_id=f"{metal_levels[0]}-1", issuer="Issuer", marketing_name="Plan",
+                 metal_level=MetalLevel(metal_levels[0])),
+            Plan(plan_id="SHARED", issuer="Issuer", marketing_name="Plan",
+                 metal_level=MetalLevel.SILVER),
+        ]
+
+    def test_one_shard_per_metal_level_with_plan_type_filter(self):
+        """Each metal level is searched once with the baseline plan types."""
+        with mock.patch.object(self.analyzer.healthcare_gov_api, 'fetch_plans', self._fetch_plans):
+            plans = self.analyzer._fetch_healthcare_gov_plans()
+
+        self.assertEqual(sorted(metal_levels[0] for _, metal_levels, _ in self.calls),
+                         ['Bronze', 'Gold', 'Platinum', 'Silver'])
+        for zipcode, _, plan_types in self.calls:
+            self.assertEqual(zipcode, "85001")
+            self.assertEqual(plan_types, ['HMO', 'PPO', 'EPO', 'POS'])
+        self.assertEqual(len(plans), 5)  # Shared plan de-duplicated
+
+    def test_raw_payloads_are_converted(self):
+        """Raw API records are converted; malformed and unknown-tier ones are skipped."""
+        payload = {'plans': [
+            {'plan_id': 'RAW1', 'plan_marketing_name': 'Raw Plan', 'issuer_name': 'Issuer',
+             'metal_level': 'Silver', 'plan_type': 'PPO', 'premium': 320,
+             'medical_deductible': 2500, 'medical_moop': 8000},
+            {'plan_id': 'RAW2', 'plan_marketing_name': 'Odd Plan', 'issuer_name': 'Issuer',
+             'metal_level': 'Expanded Bronze', 'plan_type': 'PPO'},
+            {'plan_id': 'RAW3'},  # Missing required fields
+        ]}
+
+        with mock.patch.object(self.analyzer.healthcare_gov_api, 'fetch_plans', return_value=payload):
+            with self.assertLogs('src.healthplan_navigator.analyzer', level='WARNING') as logs:
+                plans = self.analyzer._fetch_healthcare_gov_plans()
+
+        self.assertEqual([plan.plan_id for plan in plans], ['RAW1'])
+        self.assertEqual(plans[0].metal_level, MetalLevel.SILVER)
+        self.assertEqual(plans[0].plan_type, PlanType.PPO)
+        self.assertEqual(plans[0].deductible, 2500)
+        self.assertTrue(any('RAW2' in message for message in logs.output))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
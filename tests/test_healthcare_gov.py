@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the Healthcare.gov / CMS plan data integration.
+"""
+
+import asyncio
+import json
+import re
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.integrations.healthcare_gov import HealthcareGovAPI
+
+
+class _FakeResponse:
+    def __init__(self, rows):
+        self.status_code = 200
+        self.content = json.dumps(rows).encode('utf-8')
+
+
+class _FakeSession:
+    """Records CMS queries and answers each with a fixed set of rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.queries.append(params['query'])
+        return _FakeResponse(self.rows)
+
+
+class _FakeCMS(_FakeSession):
+    """Answers queries like the datastore: LIKE filters, PlanId order, LIMIT."""
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        query = params['query']
+        self.queries.append(query)
+        prefixes = re.findall(r"LIKE '%(\d+)%'", query)
+        limit = int(re.search(r"LIMIT (\d+)", query).group(1))
+        rows = sorted((row for row in self.rows
+                       if any(prefix in row['service_area_id'] for prefix in prefixes)),
+                      key=lambda row: row['id'])
+        return _FakeResponse(rows[:limit])
+
+
+class TestCMSBatching(unittest.TestCase):
+    """Test how concurrent CMS lookups are batched and split per ZIP prefix."""
+
+    def setUp(self):
+        self.api = HealthcareGovAPI(cache_dir=tempfile.mkdtemp())
+        self.api.CMS_BATCH_WINDOW_SECONDS = 0.2
+
+    def _fetch_concurrently(self, zipcodes):
+        """Run lookups on threads while another lookup is in progress."""
+        results = {}
+
+        def fetch(zipcode):
+            results[zipcode] = self.api._fetch_cms_public_data(zipcode, None, None, None, None)
+
+        # Pretend another lookup is in flight so these are batched
+        self.api._cms_callers = 1
+        threads = [threading.Thread(target=fetch, args=(zipcode,)) for zipcode in zipcodes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+            self.assertFalse(thread.is_alive(), "CMS lookup did not return")
+        return results
+
+    def test_lone_lookup_is_not_batched(self):
+        """A single lookup is queried directly and gets every row."""
+        rows = [{'id': 'A', 'service_area_id': 'AZS850'}]
+        self.api.session = _FakeSession(rows)
+
+        result = self.api._fetch_cms_public_data("85001", None, None, None, None)
+
+        self.assertEqual(result, {'plans': rows})
+        self.assertEqual(len(self.api.session.queries), 1)
+        self.assertEqual(self.api._cms_pending, {})
+
+    def test_concurrent_prefixes_share_one_query(self):
+        """Concurrent lookups are sent as one query and split by prefix."""
+        rows = [
+            {'id': 'A', 'service_area_id': 'AZS850'},
+            {'id': 'B', 'service_area_id': 'NYS100'},
+            {'id': 'C', 'service_area_id': 'AZS851'},
+        ]
+        self.api.session = _FakeSession(rows)
+
+        results = self._fetch_concurrently(["85001", "10001"])
+
+        self.assertEqual(len(self.api.session.queries), 1)
+        query = self.api.session.queries[0]
+        self.assertIn("LIKE '%850%'", query)
+        self.assertIn("LIKE '%100%'", query)
+        self.assertEqual([plan['id'] for plan in results["85001"]['plans']], ['A'])
+        self.assertEqual([plan['id'] for plan in results["10001"]['plans']], ['B'])
+
+    def test_dominant_prefix_does_not_starve_others(self):
+        """A prefix crowded out of the shared LIMIT is queried again alone."""
+        self.api.CMS_QUERY_LIMIT = 3
+        rows = [{'id': f'A{i}', 'service_area_id': 'AZS850'} for i in range(10)]
+        rows.append({'id': 'B0', 'service_area_id': 'NYS100'})
+        self.api.session = _FakeCMS(rows)
+
+        results = self._fetch_concurrently(["85001", "10001"])
+
+        self.assertEqual([plan['id'] for plan in results["85001"]['plans']], ['A0', 'A1', 'A2'])
+        self.assertEqual([plan['id'] for plan in results["10001"]['plans']], ['B0'])
+        self.assertEqual(len(self.api.session.queries), 2)
+
+    def test_malformed_row_fails_every_caller(self):
+        """A row that cannot be split fails the batch instead of hanging it."""
+        self.api.session = _FakeSession([{'id': 'A', 'service_area_id': 'AZS850'}, "not a row"])
+
+        results = self._fetch_concurrently(["85001", "10001"])
+
+        self.assertEqual(results, {"85001": {}, "10001": {}})
+        self.assertEqual(self.api._cms_pending, {})
+
+
+class TestPlanFetchBatches(unittest.TestCase):
+    """Test the batch provider network and formulary fetchers."""
+
+    def setUp(self):
+        self.api = HealthcareGovAPI(cache_dir=tempfile.mkdtemp())
+
+    def test_async_results_follow_plan_id_order(self):
+        """One result per plan ID, in the order given, duplicates included."""
+        plan_ids = ["P2", "P1", "P2"]
+
+        networks = asyncio.run(self.api.fetch_provider_networks_async(plan_ids))
+        formularies = asyncio.run(self.api.fetch_drug_formularies_async(plan_ids))
+
+        self.assertEqual([network.network_id for network in networks],
+                         ["network_P2", "network_P1", "network_P2"])
+        self.assertEqual([formulary.formulary_id for formulary in formularies],
+                         ["formulary_P2", "formulary_P1", "formulary_P2"])
+        self.assertEqual(asyncio.run(self.api.fetch_provider_networks_async([])), [])
+    def test_sync_results_fetch_each_distinct_id_once(self):
+        """The sync fetchers map each distinct plan ID to its result."""
+        with mock.patch.object(self.api, 'fetch_provider_network',
+                               wraps=self.api.fetch_provider_network) as fetch:
+            networks = self.api.fetch_provider_networks(["P2", "P1", "P2"])
+
+        self.assertEqual(list(networks), ["P2", "P1"])
+        self.assertEqual(networks["P1"].network_id, "network_P1")
+        self.assertEqual([call.args[0] for call in fetch.call_args_list], ["P2", "P1"])
+        self.assertEqual(self.api.fetch_drug_formularies(["P3"])["P3"].formulary_id, "formulary_P3")
+        self.assertEqual(self.api.fetch_provider_networks([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
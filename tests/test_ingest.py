@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for document ingestion.
+"""
+
+import asyncio
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.core.models import MetalLevel
+from src.healthplan_navigator.core.ingest import DocumentParser
+
+
+class TestParseMetadata(unittest.TestCase):
+    """Test filename-only plan identification."""
+
+    def setUp(self):
+        self.parser = DocumentParser()
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def test_fields_come_from_the_filename(self):
+        """Issuer, metal level and names are resolved without reading the PDF."""
+        pdf_file = self.temp_dir / "BCBS_Silver_Plan_2025.pdf"
+        pdf_file.write_bytes(b"not a real PDF")  # Never opened
+
+        plan = self.parser.parse_metadata(str(pdf_file))
+
+        self.assertIsNotNone(plan)
+        self.assertEqual(plan.issuer, 'Blue Cross Blue Shield')
+        self.assertEqual(plan.metal_level, MetalLevel.SILVER)
+        self.assertEqual(plan.marketing_name, 'Silver Blue Cross Blue Shield Plan')
+        self.assertTrue(plan.plan_id.startswith('BCBS_Silver'))
+        self.assertEqual((plan.monthly_premium, plan.deductible, plan.oop_max), (0, 0, 0))
+
+    def test_unidentifiable_filename_returns_none(self):
+        """Without both an issuer and a metal level in the name there is no plan."""
+        for name in ("random_notes.pdf", "BCBS_summary.pdf", "Silver_plan.docx"):
+            path = self.temp_dir / name
+            path.write_bytes(b"")
+            self.assertIsNone(self.parser.parse_metadata(str(path)), name)
+
+    def test_json_is_parsed_in_full(self):
+        """Structured formats carry their fields and are parsed normally."""
+        json_file = self.temp_dir / "plan.json"
+        json_file.write_text(json.dumps({
+            'plan_id': 'JSON001',
+            'marketing_name': 'JSON Test Plan',
+            'issuer': 'JSON Insurance',
+            'metal_level': 'gold',
+            'monthly_premium': 410
+        }))
+
+        plan = self.parser.parse_metadata(str(json_file))
+
+        self.assertEqual(plan.plan_id, 'JSON001')
+        self.assertEqual(plan.monthly_premium, 410)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestParseBatchAsync(unittest.TestCase):
+    """Test that the awaitable batch parser matches parse_batch."""
+
+    def setUp(self):
+        self.parser = DocumentParser()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for i, premium in enumerate([300, 420, 515]):
+            with open(self.temp_dir / f"plan_{i}.json", 'w') as f:
+                json.dump({
+                    'plan_id': f'ASYNC{i:03d}',
+                    'marketing_name': f'Async Plan {i}',
+                    'issuer': 'Async Insurance',
+                    'metal_level': 'silver',
+                    'monthly_premium': premium
+                }, f)
+        (self.temp_dir / "broken.json").write_text("{not json")
+        (self.temp_dir / "notes.txt").write_text("ignored")
+
+    def test_same_plans_in_same_order(self):
+        """Both paths keep the same plans, in directory order, and skip bad files."""
+        expected = self.parser.parse_batch(str(self.temp_dir), max_workers=1)
+        plans = asyncio.run(self.parser.parse_batch_async(str(self.temp_dir), max_concurrency=2))
+
+        self.assertEqual(len(expected), 3)
+        self.assertEqual([plan.plan_id for plan in plans], [plan.plan_id for plan in expected])
+        self.assertEqual([plan.monthly_premium for plan in plans],
+                         [plan.monthly_premium for plan in expected])
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the core data models.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.core.models import (
+    Plan, MetalLevel, PlanType, CostSharing, Administrative,
+    ScoringMetrics, PlanAnalysis, AnalysisReport, PlanArrays
+)
+
+
+def _plan(plan_id: str, premium: float, deductible: float, rating: float) -> Plan:
+    return Plan(
+        plan_id=plan_id,
+        issuer="Test Insurance Co",
+        marketing_name=f"Plan {plan_id}",
+        metal_level=MetalLevel.SILVER,
+        monthly_premium=premium,
+        deductible=deductible,
+        oop_max=deductible * 2,
+        cost_sharing=CostSharing(primary_care_copay=25, specialist_copay=50,
+                                 emergency_room_copay=premium),
+        administrative=Administrative(plan_rating=rating)
+    )
+
+
+class TestColumnArrays(unittest.TestCase):
+    """Test the column views over plans and their scores."""
+
+    def setUp(self):
+        plans = [_plan("B", 450.5, 2000, 4.5), _plan("A", 300, 6000, 3.0)]
+        analyses = [
+            PlanAnalysis(plan=plans[0], estimated_annual_cost=7400,
+                         metrics=ScoringMetrics(provider_network_score=10, medication_coverage_score=7,
+                                                total_cost_score=4.25, financial_protection_score=0,
+                                                administrative_simplicity_score=6.5,
+                                                plan_quality_score=9, weighted_total_score=7.37)),
+            PlanAnalysis(plan=plans[1], estimated_annual_cost=9600,
+                         metrics=ScoringMetrics(weighted_total_score=5.12)),
+        ]
+        self.plans = plans
+        self.report = AnalysisReport(client=None, plan_analyses=analyses)
+
+    def test_plan_arrays_follow_plan_order(self):
+        """Each column holds the plans' values in list order."""
+        arrays = PlanArrays.from_plans(self.plans)
+
+        np.testing.assert_array_equal(arrays.premiums, [450.5, 300])
+        np.testing.assert_array_equal(arrays.deductibles, [2000, 6000])
+        np.testing.assert_array_equal(arrays.oop_max, [4000, 12000])
+        np.testing.assert_array_equal(arrays.pcp_copay, [25, 25])
+        np.testing.assert_array_equal(arrays.specialist_copay, [50, 50])
+        np.testing.assert_array_equal(arrays.er_copay, [450.5, 300])
+        np.testing.assert_array_equal(arrays.plan_rating, [4.5, 3.0])
+        self.assertEqual(arrays.premiums.dtype, np.float32)
+
+    def test_plan_arrays_dtype_and_empty_input(self):
+        """The column dtype is configurable and no plans give empty columns."""
+        self.assertEqual(PlanArrays.from_plans(self.plans, dtype=np.float64).premiums.dtype, np.float64)
+        self.assertEqual(PlanArrays.from_plans([]).premiums.shape, (0,))
+
+    def test_report_to_arrays_uses_analysis_order(self):
+        """AnalysisReport.to_arrays follows plan_analyses."""
+        arrays = self.report.to_arrays()
+
+        np.testing.assert_array_equal(arrays.premiums, [450.5, 300])
+
+    def test_report_to_score_arrays(self):
+        """Sub-scores are float16 within 0.01; totals are float32."""
+        scores = self.report.to_score_arrays()
+
+        self.assertEqual(scores.total_cost.dtype, np.float16)
+        self.assertEqual(scores.weighted_total.dtype, np.float32)
+        np.testing.assert_allclose(scores.provider_network, [10, 0], atol=0.01)
+        np.testing.assert_allclose(scores.total_cost, [4.25, 0], atol=0.01)
+        np.testing.assert_allclose(scores.administrative_simplicity, [6.5, 0], atol=0.01)
+        np.testing.assert_allclose(scores.weighted_total, [7.37, 5.12], atol=1e-5)
+
+class TestLegacyPlanDict(unittest.TestCase):
+    """Test building plans from legacy field data."""
+
+    LEGACY = {
+        'plan_id': 'LEG001',
+        'issuer': 'Legacy Health',
+        'marketing_name': 'Legacy Gold HMO',
+        'metal_level': 'gold',
+        'plan_type': 'hmo',
+        'monthly_premium': 400.0,
+        'deductible_individual': 1000.0,
+        'oop_max_individual': 5000.0,
+    }
+
+    def test_legacy_keys_and_enum_strings(self):
+        """Legacy names fill deductible / oop_max and strings become enums."""
+        plan = Plan.from_legacy_dict(self.LEGACY)
+
+        self.assertEqual(plan.deductible, 1000.0)
+        self.assertEqual(plan.oop_max, 5000.0)
+        self.assertIs(plan.metal_level, MetalLevel.GOLD)
+        self.assertIs(plan.plan_type, PlanType.HMO)
+        self.assertEqual(self.LEGACY['metal_level'], 'gold')  # Input left alone
+
+    def test_round_trip_through_json(self):
+        """A plan saved under the legacy names and enum values loads back equal."""
+        plan = Plan.from_legacy_dict(self.LEGACY)
+        saved = json.loads(json.dumps({
+            'plan_id': plan.plan_id,
+            'issuer': plan.issuer,
+            'marketing_name': plan.marketing_name,
+            'metal_level': plan.metal_level,
+            'plan_type': plan.plan_type,
+            'monthly_premium': plan.monthly_premium,
+            'deductible_individual': plan.deductible,
+            'oop_max_individual': plan.oop_max,
+        }))
+
+        self.assertEqual(saved['metal_level'], 'Gold')
+        self.assertEqual(Plan.from_legacy_dict(saved), plan)
+
+    def test_current_names_take_precedence(self):
+        """Non-zero deductible / oop_max win over the legacy names."""
+        plan = Plan.from_legacy_dict(dict(self.LEGACY, deductible=1500.0, oop_max=0.0,
+                                          metal_level=MetalLevel.SILVER))
+
+        self.assertEqual(plan.deductible, 1500.0)
+        self.assertEqual(plan.oop_max, 5000.0)
+        self.assertIs(plan.metal_level, MetalLevel.SILVER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the analyzer's parsed-plan cache.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.analyzer import HealthPlanAnalyzer
+
+
+class TestPlanCache(unittest.TestCase):
+    """Test plan cache hits, invalidation and index pruning."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.analyzer = HealthPlanAnalyzer(output_dir=str(self.temp_dir / "reports"))
+
+    def _write_plan(self, name, premium):
+        path = self.temp_dir / name
+        with open(path, 'w') as f:
+            json.dump({
+                'plan_id': name,
+                'marketing_name': 'Cache Test Plan',
+                'issuer': 'Cache Insurance',
+                'metal_level': 'silver',
+                'monthly_premium': premium
+            }, f)
+        return path
+
+    def test_unchanged_file_is_served_from_cache(self):
+        """A second load of the same content does not parse again."""
+        path = self._write_plan("plan_a.json", 300)
+        first = self.analyzer._parse_file_cached(path)
+
+        with mock.patch.object(self.analyzer, '_parse_file', side_effect=AssertionError("parsed again")):
+            second = self.analyzer._parse_file_cached(path)
+
+        self.assertEqual(second.plan_id, first.plan_id)
+        self.assertEqual(second.monthly_premium, 300)
+
+    def test_changed_content_is_parsed_again(self):
+        """Editing a file invalidates its cached plan."""
+        path = self._write_plan("plan_a.json", 300)
+        self.analyzer._parse_file_cached(path)
+
+        self._write_plan("plan_a.json", 3000)
+        plan = self.analyzer._parse_file_cached(path)
+
+        self.assertEqual(plan.monthly_premium, 3000)
+
+    def test_cache_is_reused_across_instances(self):
+        """Persisted indexes let a new analyzer hit the cache."""
+        path = self._write_plan("plan_a.json", 300)
+        self.analyzer._parse_file_cached(path)
+        self.analyzer._save_plan_cache_index()
+
+        analyzer = HealthPlanAnalyzer(output_dir=str(self.temp_dir / "reports"))
+        with mock.patch.object(analyzer, '_parse_file', side_effect=AssertionError("parsed again")):
+            plan = analyzer._parse_file_cached(path)
+
+        self.assertEqual(plan.monthly_premium, 300)
+
+    def test_digests_are_pruned_with_evicted_plans(self):
+        """Evicting a plan also drops its file digests."""
+        with mock.patch('src.healthplan_navigator.analyzer.PLAN_CACHE_MAX_ENTRIES', 1):
+            kept = self._write_plan("plan_a.json", 300)
+            self.analyzer._parse_file_cached(kept)
+            self.analyzer._parse_file_cached(kept)  # Used twice, so it outlives plan_b
+            self.analyzer._parse_file_cached(self._write_plan("plan_b.json", 400))
+            self.analyzer._save_plan_cache_index()
+
+        cache_dir = self.temp_dir / "reports" / ".plan_cache"
+        with open(cache_dir / "index.json") as f:
+            index = json.load(f)
+        with open(cache_dir / "digests.json") as f:
+            digests = json.load(f)
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(list(digests), [str(kept.resolve())])
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
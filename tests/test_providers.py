@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for the provider network integration.
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.healthplan_navigator.core.models import Provider, ProviderNetwork, Priority
+from src.healthplan_navigator.integrations.providers import ProviderNetworkIntegration
+
+
+class _FakeNPPESResponse:
+    def __init__(self, results):
+        self.status_code = 200
+        self.headers = {}
+        self._results = results
+
+    def json(self):
+        return {'results': self._results}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _FakeNPPES:
+    """Answers NPPES searches from a table keyed by (taxonomy, postal code)."""
+
+    def __init__(self, table):
+        self.table = table
+        self.searches = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        key = (params.get('taxonomy_description'), params.get('postal_code'))
+        with self._lock:
+            self.searches.append(key)
+        if key not in self.table:
+            raise ConnectionError("registry unavailable")
+        return _FakeNPPESResponse([
+            {'number': npi, 'basic': {'first_name': 'Dr', 'last_name': npi},
+             'taxonomies': [{'desc': key[0]}]}
+            for npi in self.table[key]
+        ])
+
+
+class TestProviderCacheLog(unittest.TestCase):
+    """Test the append-only NDJSON provider cache."""
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.log_file = self.cache_dir / "provider_cache.ndjson"
+
+    def _write_log(self, lines):
+        self.log_file.write_text("".join(line + "\n" for line in lines))
+
+    def _log_lines(self):
+        return [json.loads(line) for line in self.log_file.read_text().splitlines()]
+
+    def test_later_lines_win_and_appends_reload(self):
+        """Changed providers are appended and the newest entry is loaded back."""
+        integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+        integration._cache_providers([{'npi': '1', 'name': 'A'}, {'npi': '2', 'name': 'B'}])
+        integration._cache_providers([{'npi': '1', 'name': 'A2'}])
+        integration._cache_providers([{'npi': '2', 'name': 'B'}])  # Unchanged, not appended
+
+        self.assertEqual(len(self._log_lines()), 3)
+
+        reloaded = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+        self.assertEqual(reloaded.provider_cache['1']['name'], 'A2')
+        self.assertEqual(reloaded.provider_cache['2']['name'], 'B')
+
+    def test_few_superseded_lines_do_not_compact(self):
+        """Startup only compacts once superseded lines exceed the slack."""
+        self._write_log([json.dumps({'npi': '1', 'name': 'A'}),
+                         json.dumps({'npi': '1', 'name': 'A2'})])
+
+        integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+
+        self.assertEqual(integration.provider_cache['1']['name'], 'A2')
+        self.assertEqual(len(self._log_lines()), 2)
+
+    def test_compaction_keeps_one_line_per_provider(self):
+        """Past the slack, the log is rewritten with only the live entries."""
+        integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+        integration.PROVIDER_LOG_COMPACT_SLACK = 2
+        for version in range(4):
+            integration._cache_providers([{'npi': '1', 'name': f'A{version}'}])
+
+        self.assertEqual(self._log_lines(), [{'npi': '1', 'name': 'A3'}])
+
+    def test_torn_last_line_is_skipped(self):
+        """A partially written line is dropped instead of breaking startup."""
+        self._write_log([json.dumps({'npi': '1', 'name': 'A'}), '{"npi": "2", "na'])
+
+        with self.assertLogs('src.healthplan_navigator.integrations.providers', level='WARNING'):
+            integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+
+        self.assertEqual(list(integration.provider_cache), ['1'])
+        self.assertEqual(self._log_lines(), [{'npi': '1', 'name': 'A'}])
+
+    def test_legacy_json_cache_is_migrated(self):
+        """The old whole-file JSON cache is folded into the log and removed."""
+        legacy_file = self.cache_dir / "provider_cache.json"
+        legacy_file.write_text(json.dumps({'1': {'npi': '1', 'name': 'A'}}))
+
+        integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+
+        self.assertFalse(legacy_file.exists())
+        self.assertEqual(integration.provider_cache['1']['name'], 'A')
+        self.assertEqual(self._log_lines(), [{'npi': '1', 'name': 'A'}])
+
+
+class TestProviderMatching(unittest.TestCase):
+    """Test exact and fuzzy matching of client providers against a network."""
+
+    def setUp(self):
+        self.integration = ProviderNetworkIntegration(cache_dir=tempfile.mkdtemp())
+        self.network = ProviderNetwork(
+            network_id="net-1",
+            name="Test Network",
+            providers=[
+                {'npi': '1234567890', 'name': 'Dr. Ann Lee', 'specialty': 'Dermatology'},
+                {'name': 'Dr. John Smith', 'specialty': 'Cardiology'},
+                {'name': 'Dr. Maria Garcia', 'specialty': ''},
+            ]
+        )
+
+    def _in_network(self, name, specialty, npi=None):
+        provider = Provider(name=name, specialty=specialty, npi=npi)
+        return self.integration.check_provider_in_network(provider, self.network)
+
+    def test_npi_match(self):
+        """A network entry with an NPI matches on the NPI alone."""
+        self.assertTrue(self._in_network("Someone Else", "Oncology", npi="1234567890"))
+
+    def test_fuzzy_match_thresholds(self):
+        """Names must be >85 and specialties >70 similar."""
+        self.assertTrue(self._in_network("Dr. Jon Smith", "cardiology"))
+        self.assertFalse(self._in_network("Dr. Jane Smythe", "Cardiology"))
+        self.assertFalse(self._in_network("Dr. Jon Smith", "Pediatrics"))
+
+    def test_empty_specialties_do_not_fuzzy_match(self):
+        """Two empty specialties score 0, as fuzzywuzzy scored them."""
+        self.assertFalse(self._in_network("Dr. Mario Garcia", ""))
+        self.assertFalse(self.integration._fuzzy_match(
+            Provider(name="Dr. Mario Garcia", specialty=""), self.network.providers[2]))
+
+    def test_batch_matches_single_checks(self):
+        """calculate_network_coverage agrees with per-provider checks."""
+        providers = [
+            Provider(name="Dr. Jon Smith", specialty="Cardiology", priority=Priority.MUST_KEEP),
+            Provider(name="Dr. Mario Garcia", specialty="", priority=Priority.MUST_KEEP),
+            Provider(name="Dr. Ann Lee", specialty="Dermatology", npi="1234567890"),
+        ]
+
+        coverage = self.integration.calculate_network_coverage(providers, self.network)
+
+        self.assertEqual(coverage['must_keep_covered'], 1)
+        self.assertEqual(coverage['nice_to_keep_covered'], 1)
+        self.assertEqual(
+            [self.integration.check_provider_in_network(p, self.network) for p in providers],
+            [True, False, True]
+        )
+
+class TestBulkProviderSearch(unittest.TestCase):
+    """Test the threaded search_providers_bulk path."""
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.integration = ProviderNetworkIntegration(cache_dir=str(self.cache_dir))
+        self.integration.session = _FakeNPPES({
+            ('Cardiology', '85001'): ['101', '102'],
+            ('Pediatrics', '10001'): ['201'],
+        })
+
+    def test_results_per_query_and_shared_cache(self):
+        """Each query gets its own NPPES hits plus cached matches; all are logged once."""
+        queries = [('Cardiology', '85001'), ('Pediatrics', '10001'),
+                   ('Dermatology', '60601'), ('Cardiology', '85001')]
+
+        results = self.integration.search_providers_bulk(queries)
+
+        self.assertEqual(sorted(self.integration.session.searches), sorted(set(queries)))
+        self.assertEqual(list(results), queries[:3])
+        self.assertEqual([p['npi'] for p in results[('Cardiology', '85001')]],
+                         ['101', '102', '101', '102'])  # NPPES hits, then cached matches
+        self.assertEqual([p['npi'] for p in results[('Pediatrics', '10001')]], ['201', '201'])
+        self.assertEqual(results[('Dermatology', '60601')], [])  # Failed search
+
+        self.assertEqual(sorted(self.integration.provider_cache), ['101', '102', '201'])
+        with open(self.cache_dir / "provider_cache.ndjson") as f:
+            logged = sorted(json.loads(line)['npi'] for line in f)
+        self.assertEqual(logged, ['101', '102', '201'])
+
+    def test_empty_queries(self):
+        """No queries make no requests."""
+        self.assertEqual(self.integration.search_providers_bulk([]), {})
+        self.assertEqual(self.integration.session.searches, [])
+
+
+if __name__ == "__main__":
+    unittest.main()